@@ -0,0 +1,297 @@
+"""
+Times the hot paths of the library and writes the results as JSON.
+
+Run from the repository root:
+
+    python benchmarks/bench.py [--output FILE] [--compare BASELINE]
+
+Save the results of a release as a baseline with --output, and compare
+later runs against it with --compare to catch regressions.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "examples"))
+
+from solutions import SOLUTIONS
+from pywordle import Game, Status, Wordle
+from pywordle.dictionary import DICTIONARY
+
+# The benchmarks in the order they run, as (name, function) pairs. Each
+# function returns the seconds taken by each of its repeats and how many
+# operations each repeat timed.
+BENCHMARKS = []
+
+# Repeats of each benchmark. The fastest repeat is the least disturbed by
+# other work on the machine.
+REPEATS = 5
+
+# Operations timed by each repeat of the faster benchmarks.
+LOOPS = 2000
+
+
+def benchmark(name):
+    def register(function):
+        BENCHMARKS.append((name, function))
+        return function
+    return register
+
+
+def _time_calls(function, loops=LOOPS, repeats=REPEATS):
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(loops):
+            function()
+        times.append(time.perf_counter() - start)
+    return times, loops
+
+
+def _time_each(make, operation, loops=LOOPS, repeats=REPEATS):
+    # Objects are made before timing starts so that only the operation on
+    # each of them is timed.
+    times = []
+    for _ in range(repeats):
+        objects = [make(i) for i in range(loops)]
+        start = time.perf_counter()
+        for obj in objects:
+            operation(obj)
+        times.append(time.perf_counter() - start)
+    return times, loops
+
+
+# Solutions for games that the benchmark guesses don't win.
+_OPEN_SOLUTIONS = [s.upper() for s in SOLUTIONS
+                   if s.upper() not in ("RAISE", "CLOUT")]
+
+
+def _solution(i):
+    return _OPEN_SOLUTIONS[i % len(_OPEN_SOLUTIONS)]
+
+
+@benchmark("import")
+def bench_import():
+    # Each import runs in a fresh interpreter.
+    code = ("import time; start = time.perf_counter(); import pywordle; "
+            "print(time.perf_counter() - start)")
+    times = []
+    for _ in range(REPEATS):
+        output = subprocess.run(
+            [sys.executable, "-c", code], cwd=ROOT, check=True,
+            stdout=subprocess.PIPE, universal_newlines=True).stdout
+        times.append(float(output))
+    return times, 1
+
+
+@benchmark("wordle_init")
+def bench_wordle_init():
+    return _time_calls(lambda: Wordle(SOLUTIONS), loops=20)
+
+
+@benchmark("game_init")
+def bench_game_init():
+    return _time_each(lambda i: _solution(i), lambda s: Game(s, False))
+
+
+@benchmark("is_valid")
+def bench_is_valid():
+    game = Game("CRANE", False)
+    return _time_calls(lambda: game.is_valid("raise"))
+
+
+@benchmark("is_valid_hard_mode")
+def bench_is_valid_hard_mode():
+    game = Game("CRANE", True)
+    game.guess("RAISE")
+    return _time_calls(lambda: game.is_valid("crate"))
+
+
+@benchmark("guess_first")
+def bench_guess_first():
+    return _time_each(lambda i: Game(_solution(i), False),
+                      lambda game: game.guess("RAISE"))
+
+
+@benchmark("guess_later")
+def bench_guess_later():
+    def make(i):
+        game = Game(_solution(i), False)
+        game.guess("RAISE")
+        return game
+    return _time_each(make, lambda game: game.guess("CLOUT"))
+
+
+@benchmark("guess_many")
+def bench_guess_many():
+    # The same two guesses are made in every game at once, as in a
+    # tournament, and the time is per game.
+    def make(i):
+        return [Game(_solution(j), False) for j in range(LOOPS)]
+
+    def guess_all(games):
+        Game.guess_many(games, "RAISE")
+        Game.guess_many(games, "CLOUT")
+    times, _ = _time_each(make, guess_all, loops=1)
+    return times, LOOPS
+
+
+@benchmark("color_guess")
+def bench_color_guess():
+    game = Game("CRANE", False)
+    return _time_calls(lambda: game._color_guess("RAISE"))
+
+
+@benchmark("str")
+def bench_str():
+    def make(i):
+        game = Game(_solution(i), False)
+        game.guess("RAISE")
+        game.guess("CLOUT")
+        return game
+    return _time_each(make, str)
+
+
+def _first_candidate(game):
+    candidates = game.candidates
+    return DICTIONARY[(candidates & -candidates).bit_length() - 1]
+
+
+@benchmark("self_play")
+def bench_self_play():
+    # Every solution is played by guessing the first remaining candidate,
+    # which times the game itself rather than a solver.
+    wordle = Wordle(SOLUTIONS)
+
+    def play_all():
+        for solution in wordle.solutions:
+            game = wordle.start_game(solution=solution)
+            while game.get_status() == Status.IN_PROGRESS:
+                game.guess(_first_candidate(game))
+    return _time_calls(play_all, loops=1, repeats=3)
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=ROOT, check=True,
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            universal_newlines=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _version(module):
+    try:
+        return __import__(module).__version__
+    except (ImportError, AttributeError):
+        return None
+
+
+def environment():
+    """
+    Returns:
+        The details of the machine and software the benchmarks ran on.
+    """
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc)
+        .isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpus": os.cpu_count(),
+        "numpy": _version("numpy"),
+    }
+
+
+def run(names=None):
+    """
+    Args:
+        names: Optionally the names of the benchmarks to run.
+
+    Returns:
+        A map from benchmark names to their results. The best and median
+        times are the seconds taken by one operation.
+    """
+    results = {}
+    for name, function in BENCHMARKS:
+        if names and name not in names:
+            continue
+        times, loops = function()
+        results[name] = {
+            "best": min(times) / loops,
+            "median": statistics.median(times) / loops,
+            "loops": loops,
+            "repeats": len(times),
+        }
+        print("{0:<20} {1:>12.3f} us".format(
+            name, results[name]["best"] * 1e6))
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """
+    Prints how each benchmark changed since a baseline.
+
+    Args:
+        results: The results of run.
+        baseline: The results of an earlier run.
+        tolerance: The fraction a benchmark may slow down by before it
+            counts as a regression.
+
+    Returns:
+        The names of the benchmarks that regressed.
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        ratio = result["best"] / baseline[name]["best"]
+        regressed = ratio > 1 + tolerance
+        if regressed:
+            regressions.append(name)
+        print("{0:<20} {1:>8.2f}x{2}".format(
+            name, ratio, "  REGRESSION" if regressed else ""))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("names", nargs="*",
+                        help="benchmarks to run (default: all)")
+    parser.add_argument("--output", help="write the results to this file")
+    parser.add_argument("--compare", metavar="BASELINE",
+                        help="compare the results with an earlier output")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="slowdown allowed by --compare (default: 0.2)")
+    args = parser.parse_args()
+
+    DICTIONARY.build_index()
+    report = {"environment": environment(), "results": run(args.names)}
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        print("\nCompared with {0}:".format(args.compare))
+        if compare(report["results"], baseline["results"], args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Times filtering every valid word down to those matching a first guess.
+
+Run from the repository root:
+
+    python benchmarks/filtering.py [--repeats N]
+
+The first filter of a process builds the dictionary's letter index, in
+Python or with NumPy, and later filters only combine its bitsets. Scoring
+the guess against the whole letter matrix with NumPy is timed alongside for
+comparison.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pywordle.dictionary import DICTIONARY, Dictionary
+from pywordle.feedback import WordArray, load_numpy, score, score_many
+
+GUESS = "RAISE"
+SOLUTION = "CLOUT"
+
+
+def _best(function, repeats):
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def time_first_filter(pattern, use_numpy, repeats):
+    """
+    Returns:
+        The seconds taken by the first filter of a new dictionary, which
+        builds its letter index.
+    """
+    def first_filter():
+        dictionary = Dictionary(DICTIONARY.words)
+        dictionary.build_index(use_numpy)
+        dictionary.match_mask(GUESS, pattern)
+    return _best(first_filter, repeats)
+
+
+def time_later_filter(pattern, repeats):
+    """
+    Returns:
+        The seconds taken by a filter once the letter index is built.
+    """
+    def later_filter():
+        DICTIONARY._masks.clear()
+        DICTIONARY.match_mask(GUESS, pattern)
+    DICTIONARY.build_index()
+    return _best(later_filter, repeats)
+
+
+def time_matrix_filter(pattern, repeats):
+    """
+    Returns:
+        The seconds taken to score the guess against every word with NumPy
+        and pack the matching words into a bitset.
+    """
+    np = load_numpy()
+    words = WordArray(DICTIONARY.words)
+
+    def matrix_filter():
+        matches = score_many(GUESS, words) == pattern
+        bits = np.packbits(matches, bitorder="little")
+        return int.from_bytes(bits.tobytes(), "little")
+    assert matrix_filter() == DICTIONARY.match_mask(GUESS, pattern)
+    return _best(matrix_filter, repeats)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--repeats", type=int, default=20,
+                        help="repeats of each measurement (default: 20)")
+    args = parser.parse_args()
+
+    pattern = score(GUESS, SOLUTION)
+    results = [("first filter, Python index",
+                time_first_filter(pattern, False, args.repeats))]
+    if load_numpy() is not None:
+        results.append(("first filter, NumPy index",
+                        time_first_filter(pattern, True, args.repeats)))
+    results.append(("later filter, bitsets",
+                    time_later_filter(pattern, args.repeats)))
+    if load_numpy() is not None:
+        results.append(("NumPy letter matrix",
+                        time_matrix_filter(pattern, args.repeats)))
+
+    print("{0} words, {1} against {2}".format(
+        len(DICTIONARY), GUESS, SOLUTION))
+    for name, seconds in results:
+        print("{0:<28} {1:>10.3f} ms".format(name, seconds * 1e3))
+
+
+if __name__ == "__main__":
+    main()
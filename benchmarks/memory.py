@@ -0,0 +1,75 @@
+"""
+Measures the memory held by each live game after 0, 1 and 6 guesses.
+
+Run from the repository root:
+
+    python benchmarks/memory.py [--games N]
+"""
+import argparse
+import gc
+import os
+import random
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pywordle import game as game_module
+from pywordle.dictionary import DICTIONARY
+from pywordle.game import Game
+
+
+def bytes_per_game(n_games, n_guesses, seed=0):
+    """
+    Args:
+        n_games: The number of games to keep alive at once.
+        n_guesses: The number of guesses made in each game.
+        seed: Seeds the choice of solutions and guesses.
+
+    Returns:
+        The average number of bytes allocated for each game that are still
+        held once the games are made. Shared caches aren't counted.
+    """
+    rng = random.Random(seed)
+    words = DICTIONARY.words
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+
+    games = []
+    for _ in range(n_games):
+        solution = rng.choice(words)
+        game = Game(solution, False)
+        while len(game.progress) <= n_guesses:
+            # Guesses miss so that six of them can be made.
+            guess = rng.choice(words)
+            if guess != solution:
+                game.guess(guess)
+        games.append(game)
+
+    # Caches shared by every game aren't part of any one game's footprint.
+    DICTIONARY._masks.clear()
+    game_module._ROWS.clear()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return (after - before) / n_games
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--games", type=int, default=10000,
+                        help="live games to measure (default: 10000)")
+    args = parser.parse_args()
+
+    DICTIONARY.build_index()
+    print("{0:>8} {1:>14}".format("guesses", "bytes/game"))
+    for n_guesses in (0, 1, 6):
+        size = bytes_per_game(args.games, n_guesses)
+        print("{0:>8} {1:>14.0f}".format(n_guesses, size))
+
+
+if __name__ == "__main__":
+    main()
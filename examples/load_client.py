@@ -0,0 +1,62 @@
+import asyncio
+import json
+import random
+import sys
+import time
+
+from solutions import SOLUTIONS
+
+HOST = "127.0.0.1"
+PORT = 8765
+
+# How many games to hold open at once, and how many connections to spread
+# them over.
+SESSIONS = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+CONNECTIONS = 100
+
+
+async def request(reader, writer, **request):
+    writer.write(json.dumps(request).encode() + b"\n")
+    await writer.drain()
+    return json.loads(await reader.readline())
+
+
+async def client(sessions, latencies):
+    reader, writer = await asyncio.open_connection(HOST, PORT)
+
+    # Start every game first so they are all open at the same time.
+    ids = []
+    for _ in range(sessions):
+        ids.append((await request(reader, writer, op="new"))["session"])
+
+    for session in ids:
+        for _ in range(6):
+            start = time.perf_counter()
+            response = await request(reader, writer, op="guess",
+                                     session=session,
+                                     word=random.choice(SOLUTIONS))
+            latencies.append(time.perf_counter() - start)
+            if response["status"] != "IN_PROGRESS":
+                break
+        await request(reader, writer, op="end", session=session)
+    writer.close()
+
+
+async def main():
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(client(SESSIONS // CONNECTIONS, latencies)
+                           for _ in range(CONNECTIONS)))
+    seconds = time.perf_counter() - start
+
+    latencies.sort()
+    print("{0} games, {1} guesses in {2:.1f} seconds".format(
+        SESSIONS, len(latencies), seconds))
+    print("Guesses per second: {0:.0f}".format(len(latencies) / seconds))
+    print("Median latency: {0:.2f} ms".format(
+        latencies[len(latencies) // 2] * 1000))
+    print("99th percentile latency: {0:.2f} ms".format(
+        latencies[int(len(latencies) * 0.99)] * 1000))
+
+
+asyncio.run(main())
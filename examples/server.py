@@ -0,0 +1,18 @@
+import asyncio
+
+from solutions import SOLUTIONS
+from pywordle import Wordle
+from pywordle.server import GameServer
+
+
+wordle = Wordle(SOLUTIONS)
+server = GameServer(wordle)
+
+# Serve games on localhost:8765 until interrupted. Try it with
+#   echo '{"op": "new"}' | nc localhost 8765
+# or load test it with load_client.py.
+print("Serving on 127.0.0.1:8765")
+try:
+    asyncio.run(server.serve(port=8765))
+except KeyboardInterrupt:
+    pass
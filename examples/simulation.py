@@ -0,0 +1,18 @@
+from solutions import SOLUTIONS
+from pywordle import Wordle
+from pywordle.openings import cached_opening_book
+from pywordle.simulate import simulate
+from pywordle.solver import Solver
+
+
+wordle = Wordle(SOLUTIONS)
+solver = Solver(wordle, opening_book=cached_opening_book(wordle))
+
+# Play every solution with the solver's best guesses on all CPUs.
+result = simulate(wordle, solver.best_guess)
+
+print(result)
+for guesses, count in sorted(result.distribution.items()):
+    print("{0} guesses: {1}".format(guesses, count))
+print("Seconds per game: {0:.4f}".format(result.mean_game_seconds))
+print("Total seconds: {0:.1f}".format(result.seconds))
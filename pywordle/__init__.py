@@ -1,2 +1,4 @@
+from .dictionary import Dictionary, DICTIONARY
 from .game import Game, Status
-from .wordle import Wordle
\ No newline at end of file
+from .multigame import MultiGame
+from .wordle import Wordle
@@ -0,0 +1,452 @@
+import hashlib
+import heapq
+import mmap
+import os
+import struct
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from pywordle.dictionary import bit_indices, popcount
+from pywordle.feedback import SOLVED, load_numpy, score
+from pywordle.patterns import default_cache_dir, word_list_key, \
+    write_atomically
+from pywordle.solver import Solver
+
+# Bump whenever the way trees are built or the file layout changes.
+TREE_VERSION = 1
+
+# Tree files start with a fixed-size header followed by the node arrays.
+_MAGIC = b"PYWT"
+_HEADER = struct.Struct("<4sHII20s")
+_HEADER_SIZE = 64
+
+# State shared by every subtree built in a worker process.
+_worker = None
+
+
+def decision_tree_key(guesses, solutions, lookahead):
+    """
+    Returns:
+        A digest identifying the word lists and settings a tree is built for.
+    """
+    digest = hashlib.sha1(word_list_key(guesses, solutions))
+    digest.update("{0}:{1}".format(TREE_VERSION, lookahead).encode())
+    return digest.digest()
+
+
+class DecisionTree:
+    """
+    A precomputed strategy that solves every solution of a Wordle. Each node
+    holds the guess to make and, for each feedback pattern that guess can
+    get, the node to continue from.
+
+    The tree is stored as flat arrays in compressed sparse row layout:
+    guesses[n] is the dictionary position of node n's guess, and its
+    children are edge_nodes[offsets[n]:offsets[n + 1]], reached by the
+    patterns at the same positions of edge_patterns. Node 0 is the root.
+    """
+
+    def __init__(self, dictionary, guesses, offsets, edge_nodes,
+                 edge_patterns, key=None, path=None):
+        """
+        Args:
+            dictionary: The Dictionary of valid guesses.
+            guesses: The dictionary position of each node's guess.
+            offsets: Where each node's edges start, followed by the number
+                of edges.
+            edge_nodes: The node each edge leads to.
+            edge_patterns: A bytes-like object with the pattern of each edge.
+            key: The decision_tree_key the tree was built for.
+            path: The file the arrays are memory-mapped from, if any.
+        """
+        if len(offsets) != len(guesses) + 1 or \
+                len(edge_nodes) != len(edge_patterns):
+            raise Exception("Decision tree arrays don't match")
+
+        self._dictionary = dictionary
+        self._guesses = guesses
+        self._offsets = offsets
+        self._edge_nodes = edge_nodes
+        self._edge_patterns = edge_patterns
+        self.key = key
+        self.path = path
+
+    def guess_at(self, node):
+        """
+        Returns:
+            The guess to make at a node.
+        """
+        return self._dictionary[self._guesses[node]]
+
+    def child(self, node, pattern):
+        """
+        Args:
+            node: A node of the tree.
+            pattern: The feedback pattern received for the node's guess.
+
+        Returns:
+            The node to continue from, or None if the pattern ends the game
+            or can't occur.
+        """
+        start = self._offsets[node]
+        i = self._edge_patterns.find(
+            bytes((pattern,)), start, self._offsets[node + 1])
+        return None if i == -1 else self._edge_nodes[i]
+
+    def next_guess(self, game):
+        """
+        Walks the tree along the guesses made so far.
+
+        Args:
+            game: A normal mode game of the Wordle the tree was built for.
+
+        Returns:
+            The tree's next guess, or None if the game strayed from the tree.
+        """
+        if game._hard_mode or game._dictionary is not self._dictionary:
+            return None
+
+        node = 0
+        for word in game._guesses:
+            if word != self.guess_at(node):
+                return None
+            node = self.child(node, score(word, game._solution))
+            if node is None:
+                return None
+        return self.guess_at(node)
+
+    def play(self, solution):
+        """
+        Args:
+            solution: One of the solutions the tree was built for.
+
+        Returns:
+            The guesses the tree makes to solve it.
+
+        Raises:
+            Exception: When the tree doesn't solve the solution.
+        """
+        guesses = []
+        node = 0
+        while node is not None:
+            guess = self.guess_at(node)
+            guesses.append(guess)
+            pattern = score(guess, solution)
+            if pattern == SOLVED:
+                return guesses
+            node = self.child(node, pattern)
+        raise Exception("Solution isn't in the decision tree")
+
+    def __len__(self):
+        return len(self._guesses)
+
+    def save(self, path):
+        """
+        Atomically writes the tree to a versioned cache file.
+
+        Args:
+            path: The destination file.
+        """
+        header = _HEADER.pack(
+            _MAGIC, TREE_VERSION, len(self._guesses), len(self._edge_nodes),
+            self.key or bytes(20))
+        arrays = []
+        for values in (self._guesses, self._offsets, self._edge_nodes):
+            values = array("I", values)
+            if sys.byteorder != "little":
+                values.byteswap()
+            arrays.append(values)
+        write_atomically(path, header.ljust(_HEADER_SIZE, b"\0"), *arrays,
+                         self._edge_patterns)
+
+    @classmethod
+    def open(cls, path, dictionary, key):
+        """
+        Memory-maps a cache file read-only so that every process opening it
+        shares one copy of the tree.
+
+        Args:
+            path: A cache file written by save.
+            dictionary: The Dictionary of valid guesses.
+            key: The decision_tree_key of the word lists and settings.
+
+        Returns:
+            A DecisionTree instance.
+
+        Raises:
+            Exception: When the file is not a tree for these word lists.
+        """
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            if len(mapped) < _HEADER_SIZE:
+                raise Exception("Decision tree file is truncated")
+            magic, version, n_nodes, n_edges, file_key = \
+                _HEADER.unpack_from(mapped)
+            if magic != _MAGIC or version != TREE_VERSION:
+                raise Exception("Decision tree file has an unsupported format")
+            if file_key != key:
+                raise Exception("Decision tree file was built for other words")
+
+            sizes = (n_nodes * 4, (n_nodes + 1) * 4, n_edges * 4, n_edges)
+            if len(mapped) != _HEADER_SIZE + sum(sizes):
+                raise Exception("Decision tree file is truncated")
+        except Exception:
+            mapped.close()
+            raise
+
+        view = memoryview(mapped)
+        parts = []
+        start = _HEADER_SIZE
+        for size in sizes:
+            parts.append(view[start:start + size])
+            start += size
+        arrays = [part.cast("I") for part in parts[:3]]
+        if sys.byteorder != "little":
+            # Mapped files are little-endian, so copy and swap them instead.
+            arrays = [array("I", part) for part in arrays]
+            for values in arrays:
+                values.byteswap()
+        # Edge patterns are searched with bytes.find, so they are copied.
+        return cls(dictionary, *arrays, bytes(parts[3]), key, path)
+
+    def __reduce__(self):
+        # Memory-mapped trees are mapped again by the receiving process
+        # rather than copied.
+        if self.path is not None:
+            return (DecisionTree.open, (self.path, self._dictionary, self.key))
+        return (DecisionTree, (
+            self._dictionary, array("I", self._guesses),
+            array("I", self._offsets), array("I", self._edge_nodes),
+            bytes(self._edge_patterns), self.key))
+
+    def __repr__(self):
+        return "DecisionTree({0} nodes)".format(len(self._guesses))
+
+
+class _Builder:
+    """Chooses the guesses of a decision tree for sets of candidates."""
+
+    def __init__(self, wordle):
+        self._solver = Solver(wordle)
+        self._dictionary = wordle.dictionary
+        self._table = wordle.patterns
+
+        # Map from dictionary positions of solutions to their table columns.
+        self._columns = {}
+        for column, word in enumerate(wordle.solutions):
+            i = self._dictionary.index(word)
+            if i is not None:
+                self._columns[i] = column
+
+        # Map from candidates to their greedy subtree and its cost.
+        self._greedy = {}
+
+    def split(self, guess, candidates):
+        """
+        Returns:
+            A map from each pattern the guess can get, other than solving
+            the game, to the bitset of candidates that give it.
+        """
+        groups = {}
+        for i in bit_indices(candidates):
+            pattern = self._table.pattern(guess, self._columns[i])
+            if pattern != SOLVED:
+                groups[pattern] = groups.get(pattern, 0) | 1 << i
+        return groups
+
+    def best_guesses(self, candidates, limit):
+        """
+        Returns:
+            The dictionary positions of up to limit guesses that split the
+            candidates, best first. Ties are broken in favor of candidates.
+        """
+        indices = bit_indices(candidates)
+        if len(indices) <= 2:
+            # Guessing a candidate is always best.
+            return indices[:1]
+
+        scores = self._solver.entropies(candidates, indices)
+        np = load_numpy()
+        if np is not None:
+            is_candidate = np.zeros(len(scores), dtype=bool)
+            is_candidate[indices] = True
+            order = np.lexsort((~is_candidate, -np.asarray(scores)))
+            best = [int(i) for i in order[:limit] if scores[i] > 0]
+        else:
+            def order(i):
+                return -scores[i], not candidates >> i & 1, i
+
+            best = [i for i in heapq.nsmallest(limit, range(len(scores)),
+                                               key=order) if scores[i] > 0]
+        return best
+
+    def build(self, candidates, lookahead):
+        """
+        Args:
+            candidates: A bitset of the solutions still possible.
+            lookahead: How many of the best guesses to compare by the total
+                number of guesses their greedy subtrees take.
+
+        Returns:
+            A (guess, children, cost) tuple, where children is a tuple of
+            (pattern, subtree) pairs and cost is the total number of guesses
+            made to solve every candidate.
+        """
+        if lookahead <= 1:
+            return self._build_greedy(candidates)
+        guess = self.choose(candidates, lookahead)
+        return self._build_with(guess, candidates, lookahead)
+
+    def choose(self, candidates, lookahead):
+        """
+        Returns:
+            Of the lookahead best guesses for the candidates, the one whose
+            greedy subtrees take the fewest guesses in total.
+        """
+        options = self.best_guesses(candidates, max(lookahead, 1))
+        if len(options) == 1:
+            return options[0]
+        return min(options, key=lambda guess: self._cost(guess, candidates))
+
+    def _build_greedy(self, candidates):
+        subtree = self._greedy.get(candidates)
+        if subtree is None:
+            guess = self.best_guesses(candidates, 1)[0]
+            subtree = self._build_with(guess, candidates, 1)
+            self._greedy[candidates] = subtree
+        return subtree
+
+    def _build_with(self, guess, candidates, lookahead):
+        children = []
+        cost = popcount(candidates)
+        for pattern, group in sorted(self.split(guess, candidates).items()):
+            subtree = self.build(group, lookahead)
+            children.append((pattern, subtree))
+            cost += subtree[2]
+        return guess, tuple(children), cost
+
+    def _cost(self, guess, candidates):
+        cost = popcount(candidates)
+        for group in self.split(guess, candidates).values():
+            cost += self._build_greedy(group)[2]
+        return cost
+
+
+def _init_worker(wordle, lookahead):
+    global _worker
+    _worker = (_Builder(wordle), lookahead)
+
+
+def _build_subtree(candidates):
+    builder, lookahead = _worker
+    return builder.build(candidates, lookahead)
+
+
+def _flatten(root):
+    """
+    Returns:
+        The guesses, offsets, edge nodes and edge patterns of a nested tree
+        with its nodes numbered breadth first.
+    """
+    guesses = array("I")
+    offsets = array("I", [0])
+    edge_nodes = array("I")
+    edge_patterns = bytearray()
+
+    queue = [root]
+    for guess, children, _ in queue:
+        guesses.append(guess)
+        for pattern, subtree in children:
+            edge_patterns.append(pattern)
+            edge_nodes.append(len(queue))
+            queue.append(subtree)
+        offsets.append(len(edge_nodes))
+    return guesses, offsets, edge_nodes, bytes(edge_patterns)
+
+
+def build_decision_tree(wordle, lookahead=1, workers=None):
+    """
+    Builds a tree that solves every solution of the Wordle that is a valid
+    guess, choosing the guess with the most expected information at each
+    node.
+
+    Args:
+        wordle: The Wordle to build the tree for.
+        lookahead: How many of the best guesses at each node are compared by
+            the total number of guesses their greedy subtrees take. 1 builds
+            a greedy tree.
+        workers: The number of worker processes that build the subtrees
+            below the first guess. Defaults to the number of CPUs.
+
+    Returns:
+        A DecisionTree instance.
+    """
+    builder = _Builder(wordle)
+    candidates = 0
+    for i in builder._columns:
+        candidates |= 1 << i
+    if not candidates:
+        raise Exception("No solutions are valid guesses")
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        root = builder.build(candidates, lookahead)
+    else:
+        # The first guess is chosen here and the subtrees for each of its
+        # patterns are built in parallel.
+        guess = builder.choose(candidates, lookahead)
+        groups = sorted(builder.split(guess, candidates).items())
+
+        # Build the shared structures before starting workers so that they
+        # are inherited or mapped rather than built by every worker.
+        wordle.dictionary.build_index()
+        with ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker,
+                initargs=(wordle, lookahead)) as executor:
+            subtrees = list(executor.map(
+                _build_subtree, [group for _, group in groups]))
+
+        cost = popcount(candidates) + sum(s[2] for s in subtrees)
+        root = (guess, tuple(zip([p for p, _ in groups], subtrees)), cost)
+
+    key = decision_tree_key(wordle.dictionary.words, wordle.solutions,
+                            lookahead)
+    return DecisionTree(wordle.dictionary, *_flatten(root), key)
+
+
+def cached_decision_tree(wordle, lookahead=1, workers=None, cache_dir=None):
+    """
+    Memory-maps the decision tree for the Wordle from the cache, building and
+    caching it first if needed.
+
+    Args:
+        wordle: The Wordle to build the tree for.
+        lookahead: How many of the best guesses at each node are compared.
+        workers: The number of worker processes used to build the tree.
+        cache_dir: Optionally override the cache directory.
+
+    Returns:
+        A DecisionTree instance.
+    """
+    key = decision_tree_key(wordle.dictionary.words, wordle.solutions,
+                            lookahead)
+    path = os.path.join(
+        cache_dir or default_cache_dir(),
+        "tree-v{0}-{1}.bin".format(TREE_VERSION, key.hex()))
+
+    try:
+        return DecisionTree.open(path, wordle.dictionary, key)
+    except Exception:
+        # Missing, stale or corrupt files are rebuilt below.
+        pass
+
+    tree = build_decision_tree(wordle, lookahead, workers)
+    try:
+        tree.save(path)
+    except OSError:
+        # A read-only location shouldn't prevent playing.
+        return tree
+    return DecisionTree.open(path, wordle.dictionary, key)
@@ -0,0 +1,302 @@
+from array import array
+from collections import defaultdict
+
+from pywordle.feedback import WORD_LEN, ABSENT, CORRECT, WordArray, decode, \
+    load_numpy, loaded_numpy
+from pywordle.words import read_words, unpack_words
+
+# The most match masks each dictionary keeps around for reuse.
+_MASK_CACHE_SIZE = 1024
+
+
+def popcount(mask):
+    """
+    Returns:
+        The number of words in a bitset of words.
+    """
+    try:
+        return mask.bit_count()
+    except AttributeError:
+        # int.bit_count was added in Python 3.10.
+        return bin(mask).count("1")
+
+
+def bit_indices(mask):
+    """
+    Returns:
+        The positions of the words in a bitset of words, in order.
+    """
+    bits = bin(mask)[:1:-1]
+    indices = []
+    i = bits.find("1")
+    while i != -1:
+        indices.append(i)
+        i = bits.find("1", i + 1)
+    return indices
+
+
+def _to_mask(indices, size):
+    """
+    Returns:
+        A bitset of size bits with the bits at indices set.
+    """
+    bits = bytearray((size + 7) // 8)
+    for i in indices:
+        bits[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(bits, "little")
+
+
+def pack_mask(mask):
+    """
+    Args:
+        mask: A bitset of words.
+
+    Returns:
+        The bitset, or an array of the positions of its words if that takes
+        less memory, as it does for a few words spread over a large bitset.
+    """
+    typecode = "H" if mask.bit_length() <= 0x10000 else "I"
+    if popcount(mask) * array(typecode).itemsize < mask.bit_length() // 8:
+        return array(typecode, bit_indices(mask))
+    return mask
+
+
+def unpack_mask(packed):
+    """
+    Args:
+        packed: A bitset of words or an array made by pack_mask.
+
+    Returns:
+        The bitset of words.
+    """
+    if isinstance(packed, int):
+        return packed
+    return _to_mask(packed, packed[-1] + 1 if packed else 0)
+
+
+class Dictionary:
+    """
+    An immutable, hashed index over a list of valid words.
+
+    Sets of words are represented as bitsets, which are ints where bit i is
+    set when the word at position i is in the set.
+    """
+
+    def __init__(self, words):
+        """
+        Args:
+            words: An ordered list of valid words.
+        """
+        self.words = tuple(map(str.upper, words))
+
+        # Map from each word to its position in the ordered word list.
+        self._index = dict(zip(self.words, range(len(self.words))))
+
+        # The bitset of every word in the dictionary.
+        self.all_mask = (1 << len(self.words)) - 1
+
+        # Built the first time words are filtered. Map from each position to
+        # the bitsets of words with each letter there, and from each letter
+        # to the bitsets of words with at least 1, 2, ... copies of it.
+        self._position_masks = None
+        self._count_masks = None
+
+        # Map from a guess and its feedback to the matching words.
+        self._masks = {}
+
+    @classmethod
+    def from_records(cls, data):
+        """
+        Args:
+            data: Packed 5 byte records of the valid words, in order.
+
+        Returns:
+            A Dictionary instance.
+        """
+        return cls(unpack_words(data))
+
+    def index(self, word):
+        """
+        Args:
+            word: A possible word in the dictionary.
+
+        Returns:
+            The position of the word in the dictionary, or None if the word is
+            not in the dictionary.
+        """
+        return self._index.get(word.upper())
+
+    def build_index(self, use_numpy=None):
+        """
+        Builds the letter index used to filter words. This happens the first
+        time words are filtered, but can be done up front, for example so
+        that forked worker processes inherit the index.
+
+        Args:
+            use_numpy: True to build the index with NumPy, which is over ten
+                times faster, or False to build it in Python. By default
+                NumPy is used if it has already been imported, since
+                importing it takes longer than it saves.
+        """
+        if self._position_masks is not None:
+            return
+
+        np = load_numpy() if use_numpy else \
+            None if use_numpy is False else loaded_numpy()
+        text = "".join(self.words)
+        if np is not None and text.isascii() and text.isalpha():
+            self._build_index_numpy(np)
+        else:
+            self._build_index_python()
+
+    def _build_index_python(self):
+        positions = [defaultdict(list) for _ in range(WORD_LEN)]
+        counts = defaultdict(lambda: [[] for _ in range(WORD_LEN)])
+        for n, word in enumerate(self.words):
+            seen = defaultdict(int)
+            for i, letter in enumerate(word):
+                positions[i][letter].append(n)
+                counts[letter][seen[letter]].append(n)
+                seen[letter] += 1
+
+        size = len(self.words)
+        self._position_masks = [
+            {letter: _to_mask(indices, size)
+             for letter, indices in position.items()}
+            for position in positions]
+        self._count_masks = {
+            letter: [_to_mask(indices, size) for indices in by_count]
+            for letter, by_count in counts.items()}
+
+    def _build_index_numpy(self, np):
+        # The (N, 5) letter matrix is compared with every letter at once,
+        # giving a row of booleans over the words for each position and
+        # letter, and for each letter and number of copies. Packing a row
+        # into little endian bits gives its bitset.
+        words = WordArray(self.words)
+        alphabet = np.arange(ord("A"), ord("Z") + 1, dtype=np.uint8)
+        copies = np.arange(1, WORD_LEN + 1, dtype=np.uint8)
+        at_position = words.columns[:, None, :] == alphabet[:, None]
+        at_least = words.counts >= copies[:, None, None]
+
+        def masks(rows):
+            bits = np.packbits(rows.reshape(-1, len(words)), axis=1,
+                               bitorder="little")
+            return [int.from_bytes(row.tobytes(), "little") for row in bits]
+
+        letters = [chr(c) for c in alphabet]
+        position_masks = masks(at_position)
+        count_masks = masks(at_least)
+        self._position_masks = [
+            {letter: mask
+             for letter, mask in zip(letters, position_masks[i:i + 26])
+             if mask}
+            for i in range(0, len(position_masks), 26)]
+        self._count_masks = {
+            letter: count_masks[j::26]
+            for j, letter in enumerate(letters) if count_masks[j]}
+
+    def position_mask(self, i, letter):
+        """
+        Returns:
+            The bitset of words with the letter at position i.
+        """
+        if self._position_masks is None:
+            self.build_index()
+        return self._position_masks[i].get(letter, 0)
+
+    def count_mask(self, letter, count):
+        """
+        Returns:
+            The bitset of words with at least count copies of the letter.
+        """
+        if self._count_masks is None:
+            self.build_index()
+        if count <= 0:
+            return self.all_mask
+        if count > WORD_LEN or letter not in self._count_masks:
+            return 0
+        return self._count_masks[letter][count - 1]
+
+    def match_mask(self, guess, pattern):
+        """
+        Args:
+            guess: An upper case guess.
+            pattern: The feedback pattern received for the guess.
+
+        Returns:
+            The bitset of words that would have given the same feedback.
+        """
+        key = (guess, pattern)
+        mask = self._masks.get(key)
+        if mask is not None:
+            return mask
+
+        # A word gives the same feedback exactly when it has the correct
+        # letters in place, doesn't have the other guessed letters in place,
+        # and has as many copies of each guessed letter as were marked. A
+        # letter marked absent also caps the number of copies.
+        mask = self.all_mask
+        marked = defaultdict(int)
+        capped = set()
+        for i, result in enumerate(decode(pattern)):
+            letter = guess[i]
+            if result == CORRECT:
+                mask &= self.position_mask(i, letter)
+            else:
+                mask &= ~self.position_mask(i, letter)
+
+            if result == ABSENT:
+                capped.add(letter)
+            else:
+                marked[letter] += 1
+
+        for letter, count in marked.items():
+            mask &= self.count_mask(letter, count)
+        for letter in capped:
+            mask &= ~self.count_mask(letter, marked[letter] + 1)
+
+        if len(self._masks) >= _MASK_CACHE_SIZE:
+            self._masks.clear()
+        self._masks[key] = mask
+        return mask
+
+    def words_in(self, mask):
+        """
+        Args:
+            mask: A bitset of words.
+
+        Returns:
+            The list of words in the bitset, in dictionary order.
+        """
+        return [self.words[i] for i in bit_indices(mask)]
+
+    def __reduce__(self):
+        # The shared dictionary is unpickled as the receiving process's own
+        # copy, and other dictionaries are rebuilt from their words.
+        if self is DICTIONARY:
+            return (_shared_dictionary, ())
+        return (Dictionary, (self.words,))
+
+    def __contains__(self, word):
+        return word.upper() in self._index
+
+    def __getitem__(self, i):
+        return self.words[i]
+
+    def __iter__(self):
+        return iter(self.words)
+
+    def __len__(self):
+        return len(self.words)
+
+    def __repr__(self):
+        return "Dictionary({0} words)".format(len(self.words))
+
+
+def _shared_dictionary():
+    return DICTIONARY
+
+
+# A single dictionary of valid guesses shared by every game in the process.
+DICTIONARY = Dictionary.from_records(read_words())
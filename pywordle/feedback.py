@@ -0,0 +1,185 @@
+WORD_LEN = 5
+
+# The feedback for each letter of a guess.
+ABSENT = 0
+PRESENT = 1
+CORRECT = 2
+
+# Patterns are base-3 numbers with one digit per letter, where the digit for
+# position i has weight 3 ** i.
+PATTERN_COUNT = 3 ** WORD_LEN
+SOLVED = PATTERN_COUNT - 1
+
+_WEIGHTS = tuple(3 ** i for i in range(WORD_LEN))
+
+# Sentinel for a NumPy import that hasn't been attempted yet.
+_UNLOADED = object()
+_numpy = _UNLOADED
+
+
+def load_numpy():
+    """
+    NumPy is optional and slow to import, so it is only imported the first
+    time batched scoring needs it.
+
+    Returns:
+        The numpy module, or None if it isn't installed.
+    """
+    global _numpy
+    if _numpy is _UNLOADED:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _numpy = numpy
+    return _numpy
+
+
+def loaded_numpy():
+    """
+    Returns:
+        The numpy module if load_numpy has already imported it, or None. Code
+        that only gains a little from NumPy uses this to avoid the import.
+    """
+    return None if _numpy is _UNLOADED else _numpy
+
+
+def score(guess, solution):
+    """
+    Args:
+        guess: An upper case guess.
+        solution: An upper case solution.
+
+    Returns:
+        The feedback for the guess against the solution, encoded as a base-3
+        pattern. A letter is correct if it is in the right location and
+        present if it is in the wrong location. A solution letter can only
+        mark one guessed letter, with priority given to correct letters and
+        then to the earliest guessed letters.
+    """
+    pattern = 0
+    unmatched = []
+    for i in range(WORD_LEN):
+        if guess[i] == solution[i]:
+            pattern += CORRECT * _WEIGHTS[i]
+        else:
+            unmatched.append(solution[i])
+
+    for i in range(WORD_LEN):
+        letter = guess[i]
+        if letter != solution[i] and letter in unmatched:
+            unmatched.remove(letter)
+            pattern += PRESENT * _WEIGHTS[i]
+    return pattern
+
+
+class WordArray:
+    """The letters of a list of words, laid out for batched scoring."""
+
+    def __init__(self, words):
+        """
+        Args:
+            words: A list of upper case words.
+        """
+        np = load_numpy()
+        data = "".join(words).encode("ascii")
+
+        # One row of letter codes per word, and the same codes by position.
+        self.letters = np.frombuffer(data, dtype=np.uint8).reshape(
+            -1, WORD_LEN)
+        self.columns = np.ascontiguousarray(self.letters.T)
+
+        # How many times each letter from A to Z appears in each word.
+        self.counts = np.zeros((26, len(self.letters)), dtype=np.uint8)
+        rows = np.arange(len(self.letters))
+        for column in self.columns:
+            self.counts[column - ord("A"), rows] += 1
+
+    def __len__(self):
+        return len(self.letters)
+
+
+def score_many(guess, solutions):
+    """
+    Scores a guess against many solutions at once.
+
+    Args:
+        guess: An upper case guess.
+        solutions: A list of upper case solutions, or a WordArray of them to
+            avoid preparing the letters on every call.
+
+    Returns:
+        The pattern for each solution, as a uint8 NumPy array when NumPy is
+        installed and as a list otherwise.
+    """
+    np = load_numpy()
+    if np is None:
+        return [score(guess, solution) for solution in solutions]
+
+    if not isinstance(solutions, WordArray):
+        solutions = WordArray(solutions)
+
+    codes = guess.encode("ascii")
+    correct = [solutions.columns[i] == codes[i] for i in range(WORD_LEN)]
+    patterns = np.zeros(len(solutions), dtype=np.uint8)
+    for i in range(WORD_LEN):
+        patterns += correct[i] * np.uint8(CORRECT * _WEIGHTS[i])
+
+    for code in set(codes):
+        if not ord("A") <= code <= ord("Z"):
+            # Only letters can be present in a solution.
+            continue
+        positions = [i for i in range(WORD_LEN) if codes[i] == code]
+
+        # Solution letters that weren't matched exactly mark the guessed
+        # copies of the letter as present from left to right.
+        unmatched = solutions.counts[code - ord("A")]
+        for i in positions:
+            unmatched = unmatched - correct[i]
+        for i in positions:
+            present = ~correct[i] & (unmatched > 0)
+            patterns += present * np.uint8(PRESENT * _WEIGHTS[i])
+            unmatched = unmatched - present
+    return patterns
+
+
+def score_guesses(guesses, solution):
+    """
+    Scores many guesses against one solution at once.
+
+    Args:
+        guesses: A WordArray of upper case guesses.
+        solution: An upper case solution.
+
+    Returns:
+        The pattern for each guess, as a uint8 NumPy array.
+    """
+    np = load_numpy()
+    codes = solution.encode("ascii")
+    columns = guesses.columns
+    correct = [columns[i] == codes[i] for i in range(WORD_LEN)]
+    patterns = np.zeros(len(guesses), dtype=np.uint8)
+    for i in range(WORD_LEN):
+        patterns += correct[i] * np.uint8(CORRECT * _WEIGHTS[i])
+
+    # A guessed letter is present while the solution has more copies of it
+    # that weren't matched exactly than earlier guessed copies marked
+    # present.
+    present = []
+    for i in range(WORD_LEN):
+        available = np.zeros(len(guesses), dtype=np.int8)
+        for j in range(WORD_LEN):
+            available += (columns[i] == codes[j]) & ~correct[j]
+        for k in range(i):
+            available -= (columns[k] == columns[i]) & present[k]
+        present.append(~correct[i] & (available > 0))
+        patterns += present[i] * np.uint8(PRESENT * _WEIGHTS[i])
+    return patterns
+
+
+def decode(pattern):
+    """
+    Returns:
+        A tuple with the feedback for each letter of an encoded pattern.
+    """
+    return tuple(pattern // weight % 3 for weight in _WEIGHTS)
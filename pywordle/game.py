@@ -1,12 +1,87 @@
-from collections import defaultdict
+import struct
+import time
+from array import array
+from collections import namedtuple
 from enum import Enum
-import matplotlib.pyplot as plt
 from termcolor import colored
 
-from pywordle.words import VALID_WORDS
+from pywordle import metrics
+from pywordle.dictionary import DICTIONARY, pack_mask, popcount, unpack_mask
+from pywordle.feedback import (WORD_LEN, ABSENT, PRESENT, CORRECT,
+                               WordArray, decode, load_numpy, score,
+                               score_many)
+from pywordle.hardmode import HardMode
 
 MAX_GUESSES = 6
-WORD_LEN = 5
+
+# Snapshots start with the format version, flags, max guesses, the number of
+# guesses and the index of the solution in the dictionary. The index of each
+# guess follows. A solution that isn't in the dictionary has no index, so its
+# letters are stored at the end instead.
+SNAPSHOT_VERSION = 1
+_SNAPSHOT_HEADER = struct.Struct("<BBBBH")
+_SNAPSHOT_INDEX = struct.Struct("<H")
+_HARD_MODE = 1
+_NO_INDEX = 0xFFFF
+
+# Background color of a letter for each kind of feedback.
+_BACKGROUNDS = {
+    ABSENT: "on_white", PRESENT: "on_yellow", CORRECT: "on_green"}
+
+# Map from each letter to its colored string for each kind of feedback.
+# Built on first use.
+_LETTERS = None
+
+# Map from a guess and its feedback pattern to the rendered row, shared by
+# every game.
+_ROWS = {}
+_ROW_CACHE_SIZE = 4096
+
+# The guess shown in rows that haven't been guessed yet.
+BLANK = " " * WORD_LEN
+
+
+def _letter_table():
+    global _LETTERS
+    if _LETTERS is None:
+        _LETTERS = {
+            letter: tuple(colored(letter, "grey", _BACKGROUNDS[result])
+                          for result in (ABSENT, PRESENT, CORRECT))
+            for letter in "ABCDEFGHIJKLMNOPQRSTUVWXYZ "}
+    return _LETTERS
+
+
+def render_row(guess, pattern=ABSENT):
+    """
+    Args:
+        guess: An upper case guess, or BLANK for a row that hasn't been
+            guessed yet.
+        pattern: The feedback pattern for the guess.
+
+    Returns:
+        A color-coded representation of the guessed word. A letter is white
+        if it is not in the final word, yellow if it is in the wrong
+        location, and green if it is in the correct location.
+    """
+    key = (guess, pattern)
+    row = _ROWS.get(key)
+    if row is None:
+        letters = _letter_table()
+        row = "".join(letters[letter][result]
+                      for letter, result in zip(guess, decode(pattern)))
+        if len(_ROWS) >= _ROW_CACHE_SIZE:
+            _ROWS.clear()
+        _ROWS[key] = row
+    return row
+
+
+def _as_list(patterns):
+    return patterns if isinstance(patterns, list) else patterns.tolist()
+
+
+# The outcome of the same guess in many games: each game's feedback pattern,
+# the value of its Status and the number of words it has left.
+GuessResults = namedtuple("GuessResults", ["patterns", "statuses", "left"])
 
 
 class Status(Enum):
@@ -16,28 +91,104 @@ class Status(Enum):
 
 
 class Game:
-    """Represents an individual game of Wordle."""
+    """
+    Represents an individual game of Wordle.
+
+    Games only hold references to words in a shared dictionary and compact
+    state derived from the guesses, so many of them can be kept in memory.
+    """
 
-    def __init__(self, solution, hard_mode, max_guesses):
+    __slots__ = ("_solution", "_hard_mode", "_dictionary", "_hints",
+                 "_status", "_guesses", "_applied", "_board", "_max_guesses",
+                 "_candidates", "_progress", "_undone")
+
+    def __init__(self, solution, hard_mode, max_guesses=None,
+                 dictionary=None):
         """
         Args:
             solution: The answer for the game.
             hard_mode: True if previous known letters must be used.
             max_guesses: The number of guesses allowed.
+            dictionary: The Dictionary of valid guesses. Defaults to the
+                shared dictionary of all valid words.
         """
-        self._solution = solution.upper()
+        self._dictionary = DICTIONARY if dictionary is None else dictionary
+        self._solution = self._shared_word(solution.upper())
         self._hard_mode = hard_mode
 
-        # Map from guessed letters to a list of indices.
-        self._correct_letters = defaultdict(set)
+        # Hints that hard mode guesses must use.
+        self._hints = HardMode(self._dictionary) if hard_mode else None
 
         self._status = Status.IN_PROGRESS
         self._guesses = []
+
+        # The number of guesses the state below has been updated with. Games
+        # restored from a snapshot catch up when the state is first needed.
+        self._applied = 0
+
+        # The board is rendered again only after a new guess.
+        self._board = None
         self._max_guesses = max_guesses or MAX_GUESSES
 
+        # The words in the dictionary that might be the solution, packed with
+        # pack_mask.
+        self._candidates = self._dictionary.all_mask
+
         # Keep track of how many words are left for plotting progress.
-        self.words_left = VALID_WORDS
-        self.progress = [len(self.words_left)]
+        self._progress = array("I", [len(self._dictionary)])
+
+        # The guesses taken back by undo and the state after each of them,
+        # most recent last, until a new guess is made.
+        self._undone = None
+
+    def _shared_word(self, word):
+        """
+        Returns:
+            The dictionary's copy of a word if it has one, so that games
+            don't each hold their own copy.
+        """
+        i = self._dictionary.index(word)
+        return word if i is None else self._dictionary[i]
+
+    @property
+    def progress(self):
+        """
+        Returns:
+            The number of words that might have been the solution before the
+            first guess and after each guess.
+        """
+        self._catch_up()
+        return self._progress.tolist()
+
+    @property
+    def candidates(self):
+        """
+        Returns:
+            The bitset of words in the game's dictionary that might still be
+            the solution.
+        """
+        self._catch_up()
+        return unpack_mask(self._candidates)
+
+    @property
+    def allowed(self):
+        """
+        Returns:
+            The bitset of words in the game's dictionary that are valid
+            guesses.
+        """
+        if self._hints is None:
+            return self._dictionary.all_mask
+        self._catch_up()
+        return self._hints.allowed
+
+    @property
+    def words_left(self):
+        """
+        Returns:
+            The list of valid words that might still be the solution.
+        """
+        return self._dictionary.words_in(self.candidates)
 
     def guess(self, word):
         """
@@ -46,56 +197,283 @@ class Game:
         Args:
             word: The desired guess for the game.
 
+        Returns:
+            The feedback pattern for the guess.
+
         Raises:
             Exception: When the guess is invalid.
         """
         word = word.upper()
 
+        collector = metrics.active
+        if collector is not None:
+            return self._guess_measured(word, collector)
+
+        self._validate(word)
+        self._undone = None
+
+        # Update the game state
+        pattern = score(word, self._solution)
+        self._guesses.append(self._shared_word(word))
+        self._apply(word, pattern)
+
+        # Check if the game is over
+        self._update_status()
+
+        return pattern
+
+    @staticmethod
+    def guess_many(games, word):
+        """
+        Makes the same guess in many games at once, such as every player's
+        game in a tournament. The guess is checked against each dictionary
+        once and scored against every solution in one batch, so this is much
+        faster than calling guess on each game.
+
+        Args:
+            games: The games to make the guess in.
+            word: The desired guess for the games.
+
+        Returns:
+            GuessResults holding the feedback pattern, Status value and
+            number of words left of each game, as uint8, uint8 and uint32
+            NumPy arrays when NumPy is installed and as lists otherwise.
+
+        Raises:
+            Exception: When the guess is invalid in any of the games or a game
+                is listed more than once, in which case none of the games are
+                changed.
+        """
+        word = word.upper()
+        games = list(games)
+        Game._validate_many(games, word)
+
+        np = load_numpy()
+        solutions = [game._solution for game in games]
+        if np is not None:
+            solutions = WordArray(solutions)
+        patterns = score_many(word, solutions)
+
+        collector = metrics.active
+        if collector is not None:
+            collector.count("guesses", len(games))
+
+        # Games that had the same candidates and get the same feedback are
+        # left with the same candidates, so they are narrowed down once and
+        # then share them. Games guessing the same words, as in a
+        # tournament, hold the same candidates.
+        narrowed = {}
+        statuses = []
+        left = []
+        for game, pattern in zip(games, _as_list(patterns)):
+            game._undone = None
+            game._guesses.append(game._shared_word(word))
+            game._constrain(word, pattern)
+            key = (id(game._dictionary), id(game._candidates), pattern)
+            shared = narrowed.get(key)
+            if shared is None:
+                before = game._candidates
+                game._narrow(word, pattern)
+                # Holding on to the old candidates keeps their id unique.
+                narrowed[key] = (before, game._candidates, game._progress[-1])
+            else:
+                game._board = None
+                game._candidates = shared[1]
+                game._progress.append(shared[2])
+                game._applied += 1
+            game._update_status()
+            statuses.append(game._status.value)
+            left.append(game._progress[-1])
+
+        if np is not None:
+            statuses = np.array(statuses, dtype=np.uint8)
+            left = np.array(left, dtype=np.uint32)
+        return GuessResults(patterns, statuses, left)
+
+    @staticmethod
+    def _validate_many(games, word):
+        """
+        Raises:
+            Exception: When an upper case guess is invalid in any of the games
+                or a game is listed more than once.
+        """
+        if len(set(map(id, games))) != len(games):
+            raise Exception("Game listed more than once")
+
+        # Map from the id of each dictionary to whether it has the guess.
+        valid = {}
+        for game in games:
+            game._catch_up()
+            if game._hints is not None:
+                allowed = game._hints.is_allowed(word)
+            else:
+                allowed = valid.get(id(game._dictionary))
+                if allowed is None:
+                    allowed = word in game._dictionary
+                    valid[id(game._dictionary)] = allowed
+            if not allowed:
+                raise Exception("Invalid guess")
+            if not game._status == Status.IN_PROGRESS:
+                raise Exception("Game is already over")
+
+    def _guess_measured(self, word, collector):
+        """
+        Makes a guess like guess, timing each phase and counting into a
+        Metrics.
+        """
+        clock = time.perf_counter
+        start = clock()
+        try:
+            self._validate(word)
+        except Exception:
+            collector.count("invalid_guesses")
+            raise
+        finally:
+            collector.time("guess.validate", clock() - start)
+        self._undone = None
+
+        start = clock()
+        pattern = score(word, self._solution)
+        self._guesses.append(self._shared_word(word))
+        collector.time("guess.score", clock() - start)
+
+        start = clock()
+        self._constrain(word, pattern)
+        collector.time("guess.constrain", clock() - start)
+
+        collector.count("candidates_examined", self._progress[-1])
+        start = clock()
+        self._narrow(word, pattern)
+        collector.time("guess.filter", clock() - start)
+
+        self._update_status()
+        collector.count("guesses")
+        return pattern
+
+    def _validate(self, word):
+        """
+        Raises:
+            Exception: When an upper case guess is invalid.
+        """
+        # Restored games need their hints before the next guess.
+        self._catch_up()
+
         if not self.is_valid(word):
             raise Exception("Invalid guess")
 
         if not self._status == Status.IN_PROGRESS:
             raise Exception("Game is already over")
 
-        # Update the game state
-        absent_letters = set()
-        moved_letters = defaultdict(set)
-        for i in range(WORD_LEN):
-            if self._solution[i] == word[i]:
-                self._correct_letters[word[i]].add(i)
-            elif word[i] in self._solution:
-                moved_letters[word[i]].add(i)
-            else:
-                absent_letters.add(word[i])
-
-        def is_match(word):
-            """
-            Returns True if word might be the solution, given available info.
-            """
-            for i in range(WORD_LEN):
-                for letter, indices in self._correct_letters.items():
-                    for i in indices:
-                        if word[i] != letter:
-                            return False
-                for letter, indices in moved_letters.items():
-                    for i in indices:
-                        if word[i] == letter:
-                            return False
-                for letter in absent_letters:
-                    if letter in word:
-                        return False
-            return True
-
-        self.words_left = list(filter(is_match, self.words_left))
-        self.progress.append(len(self.words_left))
+    def _apply(self, word, pattern):
+        """
+        Updates the hints, board and candidates with a guess.
+        """
+        self._constrain(word, pattern)
+        self._narrow(word, pattern)
 
-        # Check if the game is over
-        self._guesses.append(word)
-        if self._solution == word:
+    def _constrain(self, word, pattern):
+        """
+        Updates the hints that hard mode guesses must use.
+        """
+        if self._hints is not None:
+            self._hints.update(word, pattern)
+
+    def _narrow(self, word, pattern):
+        """
+        Narrows down the candidates and clears the board.
+        """
+        self._board = None
+
+        # Only words that would have given the same feedback might still be
+        # the solution.
+        candidates = unpack_mask(self._candidates) & \
+            self._dictionary.match_mask(word, pattern)
+        self._candidates = pack_mask(candidates)
+        self._progress.append(popcount(candidates))
+        self._applied += 1
+
+    def _catch_up(self):
+        """
+        Applies the guesses of a restored game that haven't been applied yet.
+        """
+        while self._applied < len(self._guesses):
+            word = self._guesses[self._applied]
+            self._apply(word, score(word, self._solution))
+
+    def _update_status(self):
+        if self._guesses and self._guesses[-1] == self._solution:
             self._status = Status.WON
         elif len(self._guesses) == self._max_guesses:
             self._status = Status.LOST
 
+    @property
+    def constraints(self):
+        """
+        Returns:
+            The log of constraints on the solution, as the list of guesses
+            and the feedback pattern each one received, in order.
+        """
+        return [(word, score(word, self._solution)) for word in self._guesses]
+
+    def undo(self):
+        """
+        Takes back the last guess. Every guess narrows the candidates with
+        only its own constraints, so the candidates before it are the words
+        matching the constraints logged before it. The state after the guess
+        is kept so that redo doesn't need to narrow the candidates again.
+
+        Returns:
+            The guess that was taken back.
+
+        Raises:
+            Exception: When no guesses have been made.
+        """
+        self._catch_up()
+        if not self._guesses:
+            raise Exception("No guesses to undo")
+
+        word = self._guesses.pop()
+        if self._undone is None:
+            self._undone = []
+        self._undone.append((word, self._candidates, self._hints,
+                             self._progress.pop(), self._status))
+
+        candidates = self._dictionary.all_mask
+        hints = HardMode(self._dictionary) if self._hard_mode else None
+        for guess, pattern in self.constraints:
+            candidates &= self._dictionary.match_mask(guess, pattern)
+            if hints is not None:
+                hints.update(guess, pattern)
+        self._candidates = pack_mask(candidates)
+        self._hints = hints
+        self._applied -= 1
+        self._board = None
+        self._status = Status.IN_PROGRESS
+        return word
+
+    def redo(self):
+        """
+        Makes the last guess taken back by undo again. Making any other guess
+        forgets the guesses that were taken back.
+
+        Returns:
+            The feedback pattern for the guess.
+
+        Raises:
+            Exception: When there are no guesses to redo.
+        """
+        if not self._undone:
+            raise Exception("No guesses to redo")
+
+        # The state after the guess was kept when it was taken back.
+        word, self._candidates, self._hints, words_left, self._status = \
+            self._undone.pop()
+        self._guesses.append(word)
+        self._progress.append(words_left)
+        self._applied += 1
+        self._board = None
+        return score(word, self._solution)
+
     def is_valid(self, word):
         """
         Args:
@@ -106,18 +484,20 @@ class Game:
         """
         word = word.upper()
 
-        # Check if word is in the list of valid words
-        if word not in VALID_WORDS:
-            return False
+        # For hard mode check if the word uses every hint
+        if self._hints is not None:
+            self._catch_up()
+            return self._hints.is_allowed(word)
 
-        # For hard mode check if correct letters are included
-        if self._hard_mode:
-            for letter, indices in self._correct_letters.items():
-                for i in indices:
-                    if word[i] != letter:
-                        return False
+        # Check if word is in the list of valid words
+        return word in self._dictionary
 
-        return True
+    def allowed_guesses(self):
+        """
+        Returns:
+            The list of every valid guess given the game state.
+        """
+        return self._dictionary.words_in(self.allowed)
 
     def get_status(self):
         """
@@ -131,71 +511,135 @@ class Game:
         Plots how the list of possible solutions has been narrowed down with
         each successive guess.
         """
+        # Plotting is optional, so only import matplotlib when it's needed.
+        import matplotlib.pyplot as plt
+
+        progress = self.progress
         fig = plt.figure()
-        plt.plot(self.progress)
+        plt.plot(progress)
         fig.gca().xaxis.get_major_locator().set_params(integer=True)
         plt.xlabel("Guess")
         plt.ylabel("Words Remaining")
         fig.savefig("progress.png")
 
-        return self.progress
+        return progress
 
-    def _color_guess(self, guess):
+    def _color_guess(self, guess, pattern=None):
         """
+        Args:
+            guess: The guessed word.
+            pattern: The feedback pattern for the guess, if already known.
+
         Returns:
             A color-coded representation of the guessed word. A letter is white
             if it is not in the final word, yellow if it is in the wrong
             location, and green if it is in the correct location.
         """
-        word = ""
-        for i in range(WORD_LEN):
-            letter = guess[i]
-            if self._solution[i] == letter:
-                # Exact match has a green background.
-                word += colored(letter, "grey", "on_green")
-            elif letter in self._solution:
-                # For inexact matches, we need to color at most the number
-                # of instances in the solution with priority given to exact
-                # matches. Steps to calculate this:
-                # 1. See if we guessed more instances of a letter than the
-                #    solution has.
-                # 2. Find if any of those guesses were an exact match and
-                #    subtract that out from the count of letters to color.
-                # 3. Start from the beginning of the word to color the
-                #    right number of inexact matches.
-                actual_count = self._solution.count(letter)
-                guessed_extra_letters = actual_count < guess.count(letter)
-                solution_indices = {i for i, c in enumerate(
-                    self._solution) if c == letter}
-                guess_indices = {i for i, c in enumerate(guess) if c == letter}
-                exact_match_count = len(
-                    solution_indices.intersection(guess_indices))
-                guess_inexact_indices = list(
-                    guess_indices.difference(solution_indices))
-                not_colored_inexact = i not in guess_inexact_indices[0:max(
-                    actual_count-exact_match_count, 0)]
-
-                if guessed_extra_letters and not_colored_inexact:
-                    word += colored(letter, "grey", "on_white")
-                else:
-                    word += colored(letter, "grey", "on_yellow")
-            else:
-                # Non-match has a white background.
-                word += colored(letter, "grey", "on_white")
-        return word
+        if pattern is None:
+            pattern = score(guess, self._solution)
+        return render_row(guess, pattern)
 
     def __str__(self):
         """
         Returns:
             A string represention of the full game.
         """
-        words = []
-        for guess in self._guesses:
-            words.append(self._color_guess(guess))
+        collector = metrics.active
+        if collector is not None:
+            collector.count("renders")
+            if self._board is None:
+                start = time.perf_counter()
+                self._render()
+                collector.time("render", time.perf_counter() - start)
+
+        if self._board is None:
+            self._render()
+        return self._board
+
+    def _render(self):
+        rows = [self._color_guess(word) for word in self._guesses]
+        blank_rows = [render_row(BLANK)] * (self._max_guesses - len(rows))
+        self._board = "\n".join(rows + blank_rows)
+
+    def to_bytes(self):
+        """
+        Serializes the game as a compact snapshot of its solution, guesses
+        and settings. The dictionary isn't included, so the game must be
+        restored with the same dictionary.
+
+        Returns:
+            The snapshot as bytes.
+        """
+        index = self._dictionary.index
+        solution = index(self._solution)
+        if solution is None or solution >= _NO_INDEX:
+            solution = _NO_INDEX
+        flags = _HARD_MODE if self._hard_mode else 0
+
+        if self._max_guesses > 255:
+            raise Exception("Too many guesses to snapshot")
+        parts = [_SNAPSHOT_HEADER.pack(
+            SNAPSHOT_VERSION, flags, self._max_guesses, len(self._guesses),
+            solution)]
+        for word in self._guesses:
+            i = index(word)
+            if i >= _NO_INDEX:
+                raise Exception("Dictionary is too large to snapshot")
+            parts.append(_SNAPSHOT_INDEX.pack(i))
+        if solution == _NO_INDEX:
+            parts.append(self._solution.encode("ascii"))
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data, dictionary=None):
+        """
+        Restores a game from a snapshot made by to_bytes. The candidates,
+        hints and board are only rebuilt once they are needed.
 
-        for i in range(self._max_guesses - len(self._guesses)):
-            words.append(self._color_guess("     "))
-        return "\n".join(words)
+        Args:
+            data: The snapshot.
+            dictionary: The Dictionary of valid guesses the game was played
+                with. Defaults to the shared dictionary of all valid words.
+
+        Returns:
+            The restored Game.
+
+        Raises:
+            Exception: When the snapshot is malformed or from an unsupported
+                version.
+        """
+        dictionary = DICTIONARY if dictionary is None else dictionary
+        try:
+            version, flags, max_guesses, n_guesses, solution = \
+                _SNAPSHOT_HEADER.unpack_from(data)
+        except struct.error:
+            raise Exception("Malformed snapshot")
+        if version != SNAPSHOT_VERSION:
+            raise Exception("Unsupported snapshot version")
+
+        offset = _SNAPSHOT_HEADER.size
+        end = offset + n_guesses * _SNAPSHOT_INDEX.size
+        if n_guesses > max_guesses or len(data) < end:
+            raise Exception("Malformed snapshot")
+        # Only a solution outside the dictionary is spelled out after the
+        # guesses.
+        if solution != _NO_INDEX and len(data) != end:
+            raise Exception("Malformed snapshot")
+        try:
+            guesses = [dictionary[i] for (i,) in
+                       _SNAPSHOT_INDEX.iter_unpack(data[offset:end])]
+            if solution == _NO_INDEX:
+                solution = bytes(data[end:]).decode("ascii")
+            else:
+                solution = dictionary[solution]
+        except (IndexError, UnicodeDecodeError):
+            raise Exception("Malformed snapshot")
+
+        game = cls(solution, bool(flags & _HARD_MODE), max_guesses,
+                   dictionary)
+        game._guesses = guesses
+        game._update_status()
+        return game
 
     def __repr__(self):
         return "Game(\"{0}\", {1})".format(self._solution, self._hard_mode)
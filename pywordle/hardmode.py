@@ -0,0 +1,82 @@
+from bisect import bisect_left
+from collections import Counter
+
+from pywordle.dictionary import pack_mask, unpack_mask
+from pywordle.feedback import ABSENT, CORRECT, decode
+
+
+class HardMode:
+    """
+    Tracks the hints revealed in a hard mode game and the guesses that use
+    all of them. Correct letters must be guessed in the same location again
+    and letters in the wrong location must be included, as many times as they
+    were revealed.
+    """
+
+    __slots__ = ("_dictionary", "correct", "required", "_allowed")
+
+    def __init__(self, dictionary):
+        """
+        Args:
+            dictionary: The Dictionary of valid guesses.
+        """
+        self._dictionary = dictionary
+
+        # Map from positions to the letters known to be there.
+        self.correct = {}
+
+        # Map from letters to how many copies guesses must include.
+        self.required = Counter()
+
+        # The words in the dictionary that are legal guesses, packed with
+        # pack_mask.
+        self._allowed = dictionary.all_mask
+
+    @property
+    def allowed(self):
+        """
+        Returns:
+            The bitset of words in the dictionary that are legal guesses.
+        """
+        return unpack_mask(self._allowed)
+
+    def update(self, guess, pattern):
+        """
+        Narrows the legal guesses with the hints revealed by a guess. Only
+        hints that weren't already known are applied.
+
+        Args:
+            guess: An upper case guess.
+            pattern: The feedback pattern received for the guess.
+        """
+        allowed = self.allowed
+        revealed = Counter()
+        for i, result in enumerate(decode(pattern)):
+            letter = guess[i]
+            if result != ABSENT:
+                revealed[letter] += 1
+            if result == CORRECT and i not in self.correct:
+                self.correct[i] = letter
+                allowed &= self._dictionary.position_mask(i, letter)
+
+        for letter, count in revealed.items():
+            if count > self.required[letter]:
+                self.required[letter] = count
+                allowed &= self._dictionary.count_mask(letter, count)
+        self._allowed = pack_mask(allowed)
+
+    def is_allowed(self, word):
+        """
+        Args:
+            word: An upper case word.
+
+        Returns:
+            Whether the word is a valid guess that uses every hint.
+        """
+        i = self._dictionary.index(word)
+        if i is None:
+            return False
+        if isinstance(self._allowed, int):
+            return bool(self._allowed >> i & 1)
+        j = bisect_left(self._allowed, i)
+        return j < len(self._allowed) and self._allowed[j] == i
@@ -0,0 +1,120 @@
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+
+# The Metrics collecting measurements, or None while instrumentation is
+# disabled. Instrumented code only checks this when it runs, so disabled
+# instrumentation costs one attribute lookup.
+active = None
+
+
+class Metrics:
+    """
+    Counters and per-phase timers collected from games while instrumentation
+    is enabled.
+
+    Counters:
+    * guesses: guesses made
+    * invalid_guesses: guesses rejected as invalid
+    * candidates_examined: candidates narrowed down by guesses
+    * renders: boards rendered as strings
+    * games_started: games started from a Wordle
+
+    Timers, in seconds:
+    * guess.validate: checking guesses are valid
+    * guess.score: scoring guesses against the solution
+    * guess.constrain: updating the hints hard mode guesses must use
+    * guess.filter: narrowing down the candidates
+    * render: rendering boards that changed since they were last rendered
+    * wordle.patterns: loading or building pattern tables
+    """
+
+    def __init__(self, callback=None):
+        """
+        Args:
+            callback: Optionally a callable that is passed the name and value
+                of each measurement as it is made, such as a metrics client.
+        """
+        self._callback = callback
+        self.counters = Counter()
+        self.timers = defaultdict(float)
+
+    def count(self, name, n=1):
+        """
+        Adds to a counter.
+        """
+        self.counters[name] += n
+        if self._callback is not None:
+            self._callback(name, n)
+
+    def time(self, name, seconds):
+        """
+        Adds to a timer.
+        """
+        self.timers[name] += seconds
+        if self._callback is not None:
+            self._callback(name, seconds)
+
+    def as_dict(self):
+        """
+        Returns:
+            A dict with the "counters" and "timers" collected so far.
+        """
+        return {"counters": dict(self.counters), "timers": dict(self.timers)}
+
+    def reset(self):
+        """
+        Clears every counter and timer.
+        """
+        self.counters.clear()
+        self.timers.clear()
+
+    def __repr__(self):
+        return "Metrics({0})".format(self.as_dict())
+
+
+def enable(callback=None):
+    """
+    Starts collecting measurements from every game in this process.
+
+    Args:
+        callback: Optionally a callable that is passed the name and value of
+            each measurement as it is made.
+
+    Returns:
+        The Metrics the measurements are collected in.
+    """
+    global active
+    active = Metrics(callback)
+    return active
+
+
+def disable():
+    """
+    Stops collecting measurements.
+
+    Returns:
+        The Metrics that were being collected, or None.
+    """
+    global active
+    metrics, active = active, None
+    return metrics
+
+
+@contextmanager
+def collect(callback=None):
+    """
+    Collects measurements within a with block.
+
+    Args:
+        callback: Optionally a callable that is passed the name and value of
+            each measurement as it is made.
+
+    Returns:
+        A context manager giving the Metrics the measurements are collected
+        in.
+    """
+    metrics = enable(callback)
+    try:
+        yield metrics
+    finally:
+        disable()
@@ -0,0 +1,201 @@
+from pywordle.dictionary import DICTIONARY, pack_mask, popcount, unpack_mask
+from pywordle.feedback import SOLVED, WordArray, load_numpy, score_many
+from pywordle.game import BLANK, Status, render_row
+
+# The number of guesses allowed beyond one per board, as in Quordle.
+EXTRA_GUESSES = 5
+
+
+class MultiGame:
+    """
+    Represents a game of Wordle played on several boards at once, as in
+    Quordle or Octordle. Every guess is made on each board that hasn't been
+    solved yet, and the game is won once every board is solved.
+    """
+
+    def __init__(self, solutions, max_guesses=None, dictionary=None):
+        """
+        Args:
+            solutions: The answer for each board.
+            max_guesses: The number of guesses allowed. Defaults to one per
+                board plus EXTRA_GUESSES.
+            dictionary: The Dictionary of valid guesses. Defaults to the
+                shared dictionary of all valid words.
+        """
+        self._dictionary = DICTIONARY if dictionary is None else dictionary
+        self._solutions = [s.upper() for s in solutions]
+        self._max_guesses = max_guesses or len(solutions) + EXTRA_GUESSES
+        if not self._solutions:
+            raise Exception("No boards to play")
+
+        # Letters of the solutions prepared for scoring. Built on the first
+        # guess.
+        self._solution_array = None
+
+        self._status = Status.IN_PROGRESS
+        self._guesses = []
+
+        # The feedback pattern of each guess on each board.
+        self._patterns = []
+
+        # For each board, the number of guesses it took to solve it or None
+        # if it hasn't been solved yet.
+        self._solved_at = [None] * len(self._solutions)
+
+        # For each board, the words in the dictionary that might be its
+        # solution, packed with pack_mask.
+        self._candidates = [self._dictionary.all_mask] * len(self._solutions)
+
+        # The boards are rendered again only after a new guess.
+        self._board = {}
+
+    def guess(self, word):
+        """
+        Makes a guess on every board that hasn't been solved yet.
+
+        Args:
+            word: The desired guess for the game.
+
+        Returns:
+            The feedback pattern for the guess on each board.
+
+        Raises:
+            Exception: When the guess is invalid.
+        """
+        word = word.upper()
+
+        if not self.is_valid(word):
+            raise Exception("Invalid guess")
+
+        if not self._status == Status.IN_PROGRESS:
+            raise Exception("Game is already over")
+
+        # Score the guess against every board at once.
+        if self._solution_array is None:
+            np = load_numpy()
+            self._solution_array = self._solutions if np is None \
+                else WordArray(self._solutions)
+        patterns = score_many(word, self._solution_array)
+        if not isinstance(patterns, list):
+            patterns = patterns.tolist()
+
+        self._guesses.append(word)
+        self._patterns.append(patterns)
+        self._board = {}
+        for i, pattern in enumerate(patterns):
+            if self._solved_at[i] is not None:
+                continue
+            candidates = unpack_mask(self._candidates[i]) & \
+                self._dictionary.match_mask(word, pattern)
+            self._candidates[i] = pack_mask(candidates)
+            if pattern == SOLVED:
+                self._solved_at[i] = len(self._guesses)
+
+        # Check if the game is over
+        if all(n is not None for n in self._solved_at):
+            self._status = Status.WON
+        elif len(self._guesses) == self._max_guesses:
+            self._status = Status.LOST
+
+        return patterns
+
+    def is_valid(self, word):
+        """
+        Args:
+            word: A possible guess in the game.
+
+        Returns:
+            Whether the word is a valid guess.
+        """
+        return word.upper() in self._dictionary
+
+    def get_status(self, board=None):
+        """
+        Args:
+            board: Optionally the position of one board.
+
+        Returns:
+            Whether the game, or the board, is won, lost, or in progress.
+        """
+        if board is None:
+            return self._status
+        if self._solved_at[board] is not None:
+            return Status.WON
+        if self._status == Status.IN_PROGRESS:
+            return Status.IN_PROGRESS
+        return Status.LOST
+
+    def candidates(self, board):
+        """
+        Args:
+            board: The position of a board.
+
+        Returns:
+            The bitset of words in the game's dictionary that might still be
+            the board's solution.
+        """
+        return unpack_mask(self._candidates[board])
+
+    def words_left(self, board):
+        """
+        Args:
+            board: The position of a board.
+
+        Returns:
+            The list of valid words that might still be the board's solution.
+        """
+        return self._dictionary.words_in(self.candidates(board))
+
+    def words_left_counts(self):
+        """
+        Returns:
+            The number of words that might still be the solution of each
+            board.
+        """
+        return [popcount(self.candidates(i))
+                for i in range(len(self._solutions))]
+
+    def render(self, columns=4):
+        """
+        Args:
+            columns: The number of boards shown side by side.
+
+        Returns:
+            A string representation of every board, laid out in rows of
+            boards. Rows after a board was solved are left blank.
+        """
+        board = self._board.get(columns)
+        if board is not None:
+            return board
+
+        blank = render_row(BLANK)
+        rows = []
+        for start in range(0, len(self._solutions), columns):
+            if rows:
+                rows.append("")
+            boards = range(start, min(start + columns, len(self._solutions)))
+            for n in range(self._max_guesses):
+                line = []
+                for i in boards:
+                    solved_at = self._solved_at[i]
+                    if n < len(self._guesses) and \
+                            (solved_at is None or n < solved_at):
+                        line.append(render_row(self._guesses[n],
+                                               self._patterns[n][i]))
+                    else:
+                        line.append(blank)
+                rows.append(" ".join(line))
+
+        board = "\n".join(rows)
+        self._board[columns] = board
+        return board
+
+    def __str__(self):
+        """
+        Returns:
+            A string represention of the full game.
+        """
+        return self.render()
+
+    def __repr__(self):
+        return "MultiGame({0})".format(self._solutions)
@@ -0,0 +1,205 @@
+import hashlib
+import os
+import struct
+
+from pywordle.feedback import PATTERN_COUNT, SOLVED, score
+from pywordle.patterns import default_cache_dir, word_list_key, \
+    write_atomically
+from pywordle.solver import Solver
+
+# Bump whenever the way books are built or the file layout changes.
+BOOK_VERSION = 1
+
+# Book files hold a header followed by the reply to each pattern.
+_MAGIC = b"PYWO"
+_HEADER = struct.Struct("<4sH?I20s")
+_REPLIES = struct.Struct("<{0}I".format(PATTERN_COUNT))
+
+# The reply stored for patterns that can't occur or that end the game.
+NO_REPLY = 0xFFFFFFFF
+
+
+def opening_book_key(guesses, solutions, hard_mode):
+    """
+    Returns:
+        A digest identifying the word lists and mode a book is built for.
+    """
+    digest = hashlib.sha1(word_list_key(guesses, solutions))
+    digest.update("{0}:{1}".format(BOOK_VERSION, hard_mode).encode())
+    return digest.digest()
+
+
+class OpeningBook:
+    """
+    The best first guess of a Wordle and the best second guess for every
+    feedback pattern the first guess can get, which don't depend on the game
+    being played.
+    """
+
+    def __init__(self, dictionary, first, replies, hard_mode=False):
+        """
+        Args:
+            dictionary: The Dictionary of valid guesses.
+            first: The dictionary position of the first guess.
+            replies: The dictionary position of the second guess for each
+                pattern, or NO_REPLY.
+            hard_mode: True if the book is for hard mode games.
+        """
+        if len(replies) != PATTERN_COUNT:
+            raise Exception("Opening book needs a reply for every pattern")
+
+        self._dictionary = dictionary
+        self._first = first
+        self._replies = tuple(replies)
+        self.hard_mode = hard_mode
+
+    @property
+    def first_guess(self):
+        """
+        Returns:
+            The best first guess.
+        """
+        return self._dictionary[self._first]
+
+    def reply(self, pattern):
+        """
+        Args:
+            pattern: The feedback pattern for the first guess.
+
+        Returns:
+            The best second guess, or None if the pattern can't occur.
+        """
+        i = self._replies[pattern]
+        return None if i == NO_REPLY else self._dictionary[i]
+
+    def lookup(self, game):
+        """
+        Args:
+            game: A game of the Wordle the book was built for.
+
+        Returns:
+            The book's next guess for the game, or None if the game is past
+            the opening or was played differently.
+        """
+        if game._hard_mode != self.hard_mode or \
+                game._dictionary is not self._dictionary:
+            return None
+
+        guesses = game._guesses
+        if not guesses:
+            return self.first_guess
+        if len(guesses) == 1 and guesses[0] == self.first_guess:
+            return self.reply(score(guesses[0], game._solution))
+        return None
+
+    def save(self, path, key):
+        """
+        Atomically writes the book to a versioned cache file.
+
+        Args:
+            path: The destination file.
+            key: The opening_book_key of the word lists.
+        """
+        header = _HEADER.pack(
+            _MAGIC, BOOK_VERSION, self.hard_mode, self._first, key)
+        write_atomically(path, header, _REPLIES.pack(*self._replies))
+
+    @classmethod
+    def load(cls, path, dictionary, key):
+        """
+        Args:
+            path: A cache file written by save.
+            dictionary: The Dictionary of valid guesses.
+            key: The opening_book_key of the word lists.
+
+        Returns:
+            An OpeningBook instance.
+
+        Raises:
+            Exception: When the file is not a book for these word lists.
+        """
+        with open(path, "rb") as f:
+            data = f.read()
+
+        if len(data) != _HEADER.size + _REPLIES.size:
+            raise Exception("Opening book file is truncated")
+        magic, version, hard_mode, first, file_key = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != BOOK_VERSION:
+            raise Exception("Opening book file has an unsupported format")
+        if file_key != key:
+            raise Exception("Opening book file was built for other words")
+        replies = _REPLIES.unpack_from(data, _HEADER.size)
+        return cls(dictionary, first, replies, hard_mode)
+
+    def __repr__(self):
+        return "OpeningBook({0!r}, hard_mode={1})".format(
+            self.first_guess, self.hard_mode)
+
+
+def build_opening_book(wordle, hard_mode=False, solver=None):
+    """
+    Finds the best first guess and the best reply to each of its patterns.
+
+    Args:
+        wordle: The Wordle to build the book for.
+        hard_mode: True to build the book for hard mode games.
+        solver: The Solver choosing the guesses. Defaults to a new one.
+
+    Returns:
+        An OpeningBook instance.
+    """
+    dictionary = wordle.dictionary
+    solver = solver or Solver(wordle)
+    first = solver.best_guess(
+        wordle.start_game(hard_mode, wordle.solutions[0]))
+
+    # The candidates after the first guess only depend on its pattern, so
+    # one game per pattern finds every reply.
+    replies = [NO_REPLY] * PATTERN_COUNT
+    for solution in wordle.solutions:
+        pattern = score(first, solution)
+        if pattern == SOLVED or replies[pattern] != NO_REPLY:
+            continue
+        game = wordle.start_game(hard_mode, solution)
+        game.guess(first)
+        reply = solver.best_guess(game)
+        if reply is not None:
+            replies[pattern] = dictionary.index(reply)
+    return OpeningBook(dictionary, dictionary.index(first), replies,
+                       hard_mode)
+
+
+def cached_opening_book(wordle, hard_mode=False, cache_dir=None,
+                        solver=None):
+    """
+    Loads the opening book for the Wordle from the cache, building and
+    caching it first if needed.
+
+    Args:
+        wordle: The Wordle to build the book for.
+        hard_mode: True to build the book for hard mode games.
+        cache_dir: Optionally override the cache directory.
+        solver: The Solver choosing the guesses if the book is built.
+
+    Returns:
+        An OpeningBook instance.
+    """
+    key = opening_book_key(wordle.dictionary.words, wordle.solutions,
+                           hard_mode)
+    path = os.path.join(
+        cache_dir or default_cache_dir(),
+        "openings-v{0}-{1}.bin".format(BOOK_VERSION, key.hex()))
+
+    try:
+        return OpeningBook.load(path, wordle.dictionary, key)
+    except Exception:
+        # Missing, stale or corrupt files are rebuilt below.
+        pass
+
+    book = build_opening_book(wordle, hard_mode, solver)
+    try:
+        book.save(path, key)
+    except OSError:
+        # A read-only location shouldn't prevent playing.
+        pass
+    return book
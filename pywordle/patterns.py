@@ -0,0 +1,385 @@
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from collections import Counter
+
+from pywordle.feedback import PATTERN_COUNT, load_numpy, score_many, \
+    WordArray
+
+# Bump whenever the pattern encoding or the cache file layout changes.
+FORMAT_VERSION = 2
+
+# Cache files start with a fixed-size header followed by the raw matrix and
+# then the bucket counts of every guess, as little endian integers.
+_MAGIC = b"PYWP"
+_HEADER = struct.Struct("<4sHII20s")
+_HEADER_SIZE = 64
+
+# How many guesses are counted at once. Small enough that each block of keys
+# stays in the CPU cache, and that every key fits in 16 bits.
+_BLOCK_SIZE = 32
+
+
+def count_buckets(patterns, columns=None):
+    """
+    Counts how many solutions get each pattern from each guess.
+
+    Args:
+        patterns: A NumPy array with one row of patterns per guess.
+        columns: Optionally the columns of the solutions to count, in which
+            case the other columns are ignored.
+
+    Returns:
+        A NumPy array with one row per guess of how many solutions get each
+        pattern.
+    """
+    np = load_numpy()
+    n_guesses = len(patterns)
+    n_columns = patterns.shape[1] if columns is None else len(columns)
+    counts = np.empty((n_guesses, PATTERN_COUNT), dtype=np.int32)
+
+    # Each guess's patterns are counted in its own range of bins, which
+    # builds every histogram in a block with one bincount. The keys and the
+    # columns taken are written to buffers reused by every block.
+    offsets = np.arange(_BLOCK_SIZE, dtype=np.uint16)[:, None] * \
+        np.uint16(PATTERN_COUNT)
+    keys = np.empty((_BLOCK_SIZE, n_columns), dtype=np.uint16)
+    taken = None if columns is None else \
+        np.empty((_BLOCK_SIZE, n_columns), dtype=np.uint8)
+    for start in range(0, n_guesses, _BLOCK_SIZE):
+        block = patterns[start:start + _BLOCK_SIZE]
+        n = len(block)
+        if columns is not None:
+            block = np.take(block, columns, axis=1, out=taken[:n])
+        np.add(block, offsets[:n], out=keys[:n])
+        counts[start:start + n] = np.bincount(
+            keys[:n].ravel(), minlength=n * PATTERN_COUNT).reshape(
+                n, PATTERN_COUNT)
+    return counts
+
+
+def _count_typecode(n_solutions):
+    return "H" if n_solutions <= 0xFFFF else "I"
+
+
+def word_list_key(guesses, solutions):
+    """
+    Returns:
+        A digest identifying a pair of word lists and the pattern encoding.
+    """
+    digest = hashlib.sha1()
+    digest.update(str(FORMAT_VERSION).encode())
+    for words in (guesses, solutions):
+        digest.update(b"\0")
+        digest.update("\n".join(words).encode())
+    return digest.digest()
+
+
+def default_cache_dir():
+    """
+    Returns:
+        The directory used to cache pattern tables. Can be overridden with the
+        PYWORDLE_CACHE_DIR environment variable.
+    """
+    return os.environ.get("PYWORDLE_CACHE_DIR") or os.path.join(
+        os.path.expanduser("~"), ".cache", "pywordle")
+
+
+def _umask():
+    # The umask can only be read by setting it, so it is set back at once.
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+def write_atomically(path, *chunks):
+    """
+    Writes a file through a temporary file that replaces it once complete, so
+    readers never see a partially written file.
+
+    Args:
+        path: The destination file.
+        chunks: The bytes-like objects to write, in order.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+        # Temporary files are only readable by their owner, but caches are
+        # shared, so give the file the mode a new file would get.
+        os.chmod(tmp_path, 0o666 & ~_umask())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class PatternTable:
+    """A guess by solution matrix of precomputed feedback patterns."""
+
+    def __init__(self, guesses, solutions, data, path=None, counts=None):
+        """
+        Args:
+            guesses: Ordered list of guesses indexing the rows.
+            solutions: Ordered list of solutions indexing the columns.
+            data: A bytes-like object holding one pattern per byte in row
+                major order.
+            path: The file the data is memory-mapped from, if any.
+            counts: Optionally a bytes-like object holding the bucket counts
+                as saved. They are counted when first needed otherwise.
+        """
+        if len(data) != len(guesses) * len(solutions):
+            raise Exception("Pattern data doesn't match the word lists")
+        if counts is not None and \
+                len(counts) != _counts_size(len(guesses), len(solutions)):
+            raise Exception("Bucket counts don't match the word lists")
+
+        self.guesses = guesses
+        self.solutions = solutions
+        self.n_guesses = len(guesses)
+        self.n_solutions = len(solutions)
+        self._data = data
+        self._counts = counts
+        self.path = path
+
+    def pattern(self, guess_index, solution_index):
+        """
+        Returns:
+            The feedback pattern for the guess against the solution.
+        """
+        return self._data[guess_index * self.n_solutions + solution_index]
+
+    def row(self, guess_index):
+        """
+        Returns:
+            A read-only view of the patterns for a guess against every
+            solution.
+        """
+        start = guess_index * self.n_solutions
+        return memoryview(self._data)[start:start + self.n_solutions]
+
+    def array(self):
+        """
+        Returns:
+            A read-only NumPy view of the table with one row per guess and one
+            column per solution. The view shares memory with the table.
+        """
+        np = load_numpy()
+        return np.frombuffer(self._data, dtype=np.uint8).reshape(
+            self.n_guesses, self.n_solutions)
+
+    def bucket_counts(self):
+        """
+        Returns:
+            A read-only NumPy array with one row per guess of how many
+            solutions get each pattern from the guess.
+        """
+        np = load_numpy()
+        dtype = np.dtype(_count_typecode(self.n_solutions)).newbyteorder("<")
+        return np.frombuffer(self._count_bytes(), dtype=dtype).reshape(
+            self.n_guesses, PATTERN_COUNT)
+
+    def _count_bytes(self):
+        """
+        Returns:
+            The bucket counts as little endian integers, counting them first
+            if needed.
+        """
+        if self._counts is None:
+            typecode = _count_typecode(self.n_solutions)
+            np = load_numpy()
+            if np is None:
+                counts = array(typecode)
+                for i in range(self.n_guesses):
+                    row = Counter(self.row(i))
+                    counts.extend(row[p] for p in range(PATTERN_COUNT))
+                if sys.byteorder != "little":
+                    counts.byteswap()
+                self._counts = counts.tobytes()
+            else:
+                self._counts = count_buckets(self.array()).astype(
+                    np.dtype(typecode).newbyteorder("<")).tobytes()
+        return self._counts
+
+    def save(self, path):
+        """
+        Atomically writes the table to a versioned cache file.
+
+        Args:
+            path: The destination file.
+        """
+        header = _HEADER.pack(
+            _MAGIC,
+            FORMAT_VERSION,
+            self.n_guesses,
+            self.n_solutions,
+            word_list_key(self.guesses, self.solutions))
+        write_atomically(path, header.ljust(_HEADER_SIZE, b"\0"), self._data,
+                         self._count_bytes())
+
+    @classmethod
+    def load(cls, path, guesses, solutions):
+        """
+        Args:
+            path: A cache file written by save.
+            guesses: The guesses the table is expected to cover.
+            solutions: The solutions the table is expected to cover.
+
+        Returns:
+            A PatternTable instance.
+
+        Raises:
+            Exception: When the file is not a table for these word lists.
+        """
+        with open(path, "rb") as f:
+            header = f.read(_HEADER_SIZE)
+            data = f.read()
+
+        _check_header(header, guesses, solutions, len(data))
+        size = len(guesses) * len(solutions)
+        return cls(guesses, solutions, data[:size], counts=data[size:])
+
+    @classmethod
+    def open(cls, path, guesses, solutions):
+        """
+        Memory-maps a cache file read-only so that every process opening it
+        shares one copy of the table through the page cache.
+
+        Args:
+            path: A cache file written by save.
+            guesses: The guesses the table is expected to cover.
+            solutions: The solutions the table is expected to cover.
+
+        Returns:
+            A PatternTable instance.
+
+        Raises:
+            Exception: When the file is not a table for these word lists.
+        """
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            _check_header(mapped[:_HEADER_SIZE], guesses, solutions,
+                          len(mapped) - _HEADER_SIZE)
+        except Exception:
+            mapped.close()
+            raise
+        view = memoryview(mapped)[_HEADER_SIZE:]
+        size = len(guesses) * len(solutions)
+        return cls(guesses, solutions, view[:size], path, view[size:])
+
+    def __reduce__(self):
+        # Memory-mapped tables are mapped again by the receiving process
+        # rather than copied.
+        if self.path is not None:
+            return (PatternTable.open,
+                    (self.path, self.guesses, self.solutions))
+        counts = None if self._counts is None else bytes(self._counts)
+        return (PatternTable,
+                (self.guesses, self.solutions, bytes(self._data), None,
+                 counts))
+
+    def __repr__(self):
+        return "PatternTable({0}x{1})".format(self.n_guesses, self.n_solutions)
+
+
+def _counts_size(n_guesses, n_solutions):
+    return n_guesses * PATTERN_COUNT * \
+        array(_count_typecode(n_solutions)).itemsize
+
+
+def _check_header(header, guesses, solutions, size):
+    if len(header) < _HEADER_SIZE:
+        raise Exception("Pattern table file is truncated")
+
+    magic, version, n_guesses, n_solutions, key = _HEADER.unpack_from(header)
+    if magic != _MAGIC or version != FORMAT_VERSION:
+        raise Exception("Pattern table file has an unsupported format")
+    if (n_guesses, n_solutions) != (len(guesses), len(solutions)) or \
+            key != word_list_key(guesses, solutions):
+        raise Exception("Pattern table file was built for other words")
+    if size != n_guesses * n_solutions + _counts_size(n_guesses, n_solutions):
+        raise Exception("Pattern table file is truncated")
+
+
+def build_pattern_table(guesses, solutions):
+    """
+    Computes the feedback pattern of every guess against every solution.
+
+    Args:
+        guesses: Ordered list of guesses.
+        solutions: Ordered list of solutions.
+
+    Returns:
+        A PatternTable instance.
+    """
+    guesses = tuple(guesses)
+    solutions = tuple(solutions)
+
+    targets = solutions if load_numpy() is None or not solutions else \
+        WordArray(solutions)
+
+    data = bytearray(len(guesses) * len(solutions))
+    for i, guess in enumerate(guesses):
+        start = i * len(solutions)
+        data[start:start + len(solutions)] = bytes(score_many(guess, targets))
+    return PatternTable(guesses, solutions, bytes(data))
+
+
+def open_pattern_table(path, guesses, solutions):
+    """
+    Memory-maps the pattern table stored at path, building and saving it
+    first if the file is missing or was built for other words.
+
+    Args:
+        path: The file holding the table.
+        guesses: Ordered list of guesses.
+        solutions: Ordered list of solutions.
+
+    Returns:
+        A PatternTable instance.
+    """
+    guesses = tuple(guesses)
+    solutions = tuple(solutions)
+
+    try:
+        return PatternTable.open(path, guesses, solutions)
+    except Exception:
+        # Missing, stale or corrupt files are rebuilt below.
+        pass
+
+    table = build_pattern_table(guesses, solutions)
+    try:
+        table.save(path)
+    except OSError:
+        # A read-only location shouldn't prevent playing.
+        return table
+    return PatternTable.open(path, guesses, solutions)
+
+
+def cached_pattern_table(guesses, solutions, cache_dir=None):
+    """
+    Memory-maps the pattern table for the word lists from the cache, building
+    and caching it first if needed.
+
+    Args:
+        guesses: Ordered list of guesses.
+        solutions: Ordered list of solutions.
+        cache_dir: Optionally override the cache directory.
+
+    Returns:
+        A PatternTable instance.
+    """
+    path = os.path.join(
+        cache_dir or default_cache_dir(),
+        "patterns-v{0}-{1}.bin".format(
+            FORMAT_VERSION, word_list_key(guesses, solutions).hex()))
+    return open_pattern_table(path, guesses, solutions)
@@ -0,0 +1,149 @@
+import datetime
+import hashlib
+import math
+import random
+from array import array
+
+# The day of the first Wordle puzzle, which is day 0 by default.
+EPOCH = datetime.date(2021, 6, 19)
+
+
+class Scheduler:
+    """
+    Picks the solution for each day, or for each game of a tenant, from a
+    fixed shuffled rotation of a Wordle's solutions.
+
+    The rotation only depends on the solutions and the seed, so servers
+    configured with the same seed agree on every puzzle without coordinating.
+    Lookups index into the rotation rather than replaying a random generator.
+    """
+
+    def __init__(self, wordle, seed=0, epoch=EPOCH):
+        """
+        Args:
+            wordle: The Wordle to pick solutions from.
+            seed: Seeds the rotation. Every server must use the same seed.
+            epoch: The date of day 0.
+        """
+        if not wordle.solutions:
+            raise Exception("No solutions to schedule")
+
+        self._wordle = wordle
+        self._seed = seed
+        self.epoch = epoch
+
+        # Solution ids in the order they are played. Once every solution
+        # has been played the rotation starts over.
+        rotation = list(range(len(wordle.solutions)))
+        random.Random(seed).shuffle(rotation)
+        self._rotation = array("I", rotation)
+
+    def day_number(self, day):
+        """
+        Args:
+            day: A date or datetime, or a day number. Datetimes count from
+                their date, whatever the time of day.
+
+        Returns:
+            The number of days since the epoch.
+        """
+        # Datetimes are dates too, but can't be subtracted from one.
+        if isinstance(day, datetime.datetime):
+            day = day.date()
+        if isinstance(day, datetime.date):
+            return (day - self.epoch).days
+        return day
+
+    def solution_id_for_day(self, day):
+        """
+        Args:
+            day: A date, or a day number.
+
+        Returns:
+            The id of the day's solution in the Wordle's solutions.
+        """
+        return self._rotation[self.day_number(day) % len(self._rotation)]
+
+    def solution_for_day(self, day):
+        """
+        Args:
+            day: A date, or a day number.
+
+        Returns:
+            The day's solution.
+        """
+        return self._wordle.solutions[self.solution_id_for_day(day)]
+
+    def start_daily_game(self, day, hard_mode=False, max_guesses=None):
+        """
+        Args:
+            day: A date, or a day number.
+            hard_mode: True if previous known letters must be used.
+            max_guesses: The number of guesses allowed.
+
+        Returns:
+            A Game instance for the day's puzzle.
+        """
+        return self._wordle.start_game_by_id(
+            self.solution_id_for_day(day), hard_mode, max_guesses)
+
+    def solution_id_for_tenant(self, tenant, n):
+        """
+        Each tenant walks the whole rotation in its own order, starting at
+        its own offset, so tenants see every solution once before any
+        repeats.
+
+        Args:
+            tenant: A string identifying the tenant.
+            n: The number of the tenant's game, from 0.
+
+        Returns:
+            The id of the solution in the Wordle's solutions.
+        """
+        offset, stride = self._tenant_walk(tenant)
+        return self._rotation[(offset + n * stride) % len(self._rotation)]
+
+    def solution_for_tenant(self, tenant, n):
+        """
+        Args:
+            tenant: A string identifying the tenant.
+            n: The number of the tenant's game, from 0.
+
+        Returns:
+            The solution of the tenant's nth game.
+        """
+        return self._wordle.solutions[self.solution_id_for_tenant(tenant, n)]
+
+    def start_tenant_game(self, tenant, n, hard_mode=False, max_guesses=None):
+        """
+        Args:
+            tenant: A string identifying the tenant.
+            n: The number of the tenant's game, from 0.
+            hard_mode: True if previous known letters must be used.
+            max_guesses: The number of guesses allowed.
+
+        Returns:
+            A Game instance for the tenant's nth game.
+        """
+        return self._wordle.start_game_by_id(
+            self.solution_id_for_tenant(tenant, n), hard_mode, max_guesses)
+
+    def _tenant_walk(self, tenant):
+        """
+        Returns:
+            The offset into the rotation and the stride, coprime with its
+            length, that a tenant walks it with. They come from a digest
+            rather than hash so that every process agrees on them.
+        """
+        size = len(self._rotation)
+        digest = hashlib.sha1(
+            "{0}\0{1}".format(self._seed, tenant).encode()).digest()
+        offset = int.from_bytes(digest[:8], "little") % size
+        stride = int.from_bytes(digest[8:16], "little") % size or 1
+        while math.gcd(stride, size) != 1:
+            stride += 1
+        return offset, stride
+
+    def __repr__(self):
+        return "Scheduler({0} solutions, seed={1!r})".format(
+            len(self._rotation), self._seed)
@@ -0,0 +1,258 @@
+import asyncio
+import json
+import secrets
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from pywordle.feedback import decode
+from pywordle.game import Status
+from pywordle.solver import Solver
+
+# Requests are single lines of JSON, so longer lines are rejected.
+MAX_LINE_LENGTH = 4096
+
+# The most guesses a game can allow, since snapshots store it in a byte.
+MAX_GUESSES = 255
+
+# The most hints one request can ask for.
+MAX_HINTS = 100
+
+
+def _small_int(request, field, default, maximum):
+    """
+    Returns:
+        The field of a request, which must be an int from 1 to the maximum,
+        or the default if the request doesn't have it.
+
+    Raises:
+        Exception: When the field isn't such an int.
+    """
+    if field not in request:
+        return default
+    value = request[field]
+    if type(value) is not int or not 1 <= value <= maximum:
+        raise Exception("Invalid {0}".format(field))
+    return value
+
+
+class Session:
+    """A game hosted by the server for a client."""
+
+    __slots__ = ("game", "last_used")
+
+    def __init__(self, game):
+        self.game = game
+        self.last_used = time.monotonic()
+
+
+class GameServer:
+    """
+    Hosts many concurrent games in one asyncio event loop, speaking a line
+    protocol where every request and response is a JSON object on one line.
+
+    Requests have an "op" naming the operation:
+    * {"op": "new", "hard_mode": false, "max_guesses": 6} starts a game and
+      responds with its "session" id.
+    * {"op": "guess", "session": id, "word": "RAISE"} makes a guess and
+      responds with the "feedback" for each letter (0 absent, 1 in the wrong
+      location, 2 correct), the game "status", how many words are "left"
+      and, once the game is over, the "solution".
+    * {"op": "valid", "session": id, "word": "RAISE"} responds with whether
+      the word is a "valid" guess.
+    * {"op": "hint", "session": id, "limit": 5} responds with the best
+      "hints" as [guess, bits] pairs.
+    * {"op": "end", "session": id} ends a game.
+
+    Every response has "ok" set to true, or to false with an "error". Any
+    "id" in a request is echoed back in its response.
+    """
+
+    def __init__(self, wordle, idle_timeout=600.0, max_sessions=100000,
+                 executor=None, max_pending_hints=64):
+        """
+        Args:
+            wordle: The Wordle games are started from.
+            idle_timeout: Seconds after which an unused game is evicted.
+            max_sessions: The most games hosted at once.
+            executor: Runs CPU bound work such as hints off the event loop.
+                Defaults to a single worker thread.
+            max_pending_hints: The most hints queued for the executor at once.
+                Clients asking for more wait until earlier hints are done.
+        """
+        self._wordle = wordle
+        self._idle_timeout = idle_timeout
+        self._max_sessions = max_sessions
+        self._executor = executor or ThreadPoolExecutor(max_workers=1)
+        self._max_pending_hints = max_pending_hints
+
+        # Made now so the first hint doesn't wait for NumPy to be imported.
+        self._solver = Solver(wordle)
+
+        # Semaphores belong to the event loop running when they are made on
+        # older Pythons, so this is made by the loop serving hints.
+        self._pending_hints = None
+        self._hints_loop = None
+
+        # Sessions from least to most recently used.
+        self.sessions = OrderedDict()
+
+    async def handle(self, reader, writer):
+        """
+        Serves one client connection. Requests are answered in order, and the
+        next request is only read once the response has been flushed, so a
+        slow client can't make the server buffer unbounded output.
+        """
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # The line was longer than the stream limit.
+                    break
+                if not line:
+                    break
+                response = await self.respond(line)
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def respond(self, line):
+        """
+        Args:
+            line: A request line.
+
+        Returns:
+            The response to the request.
+        """
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError
+        except ValueError:
+            return {"ok": False, "error": "Malformed request"}
+
+        try:
+            response = await self._dispatch(request)
+        except Exception as e:
+            response = {"ok": False, "error": str(e)}
+        if "id" in request:
+            response["id"] = request["id"]
+        return response
+
+    async def _dispatch(self, request):
+        op = request.get("op")
+        if op == "new":
+            return self._new(request)
+
+        session = self._session(request)
+        if op == "guess":
+            return self._guess(session, request)
+        if op == "valid":
+            return {"ok": True,
+                    "valid": session.game.is_valid(str(request["word"]))}
+        if op == "hint":
+            return await self._hint(session, request)
+        if op == "end":
+            del self.sessions[request["session"]]
+            return {"ok": True}
+        raise Exception("Unknown op")
+
+    def _new(self, request):
+        if len(self.sessions) >= self._max_sessions:
+            raise Exception("Too many games in progress")
+
+        # Only JSON booleans are accepted, since "false" or 0 would
+        # otherwise be taken for true or false without complaint.
+        hard_mode = request.get("hard_mode", False)
+        if type(hard_mode) is not bool:
+            raise Exception("Invalid hard_mode")
+
+        game = self._wordle.start_game(
+            hard_mode=hard_mode,
+            max_guesses=_small_int(request, "max_guesses", None, MAX_GUESSES))
+        session_id = secrets.token_hex(8)
+        self.sessions[session_id] = Session(game)
+        return {"ok": True, "session": session_id,
+                "max_guesses": game._max_guesses}
+
+    def _session(self, request):
+        session = self.sessions.get(request.get("session"))
+        if session is None:
+            raise Exception("Unknown session")
+
+        session.last_used = time.monotonic()
+        self.sessions.move_to_end(request["session"])
+        return session
+
+    def _guess(self, session, request):
+        game = session.game
+        pattern = game.guess(str(request["word"]))
+        status = game.get_status()
+        response = {"ok": True, "feedback": list(decode(pattern)),
+                    "status": status.name, "left": game.progress[-1]}
+        if status != Status.IN_PROGRESS:
+            response["solution"] = game._solution
+        return response
+
+    async def _hint(self, session, request):
+        limit = _small_int(request, "limit", 5, MAX_HINTS)
+        loop = asyncio.get_running_loop()
+        if self._hints_loop is not loop:
+            self._pending_hints = asyncio.Semaphore(self._max_pending_hints)
+            self._hints_loop = loop
+
+        async with self._pending_hints:
+            # The game is read here, since guesses on the loop could change
+            # it while the worker ranks.
+            game = session.game
+            ranking = await loop.run_in_executor(
+                self._executor, self._solver.rank_bitsets, game.candidates,
+                game.allowed, limit)
+        return {"ok": True, "hints": ranking}
+
+    def evict_idle(self):
+        """
+        Ends every game that hasn't been used within the idle timeout.
+
+        Returns:
+            The number of games ended.
+        """
+        cutoff = time.monotonic() - self._idle_timeout
+        evicted = 0
+        while self.sessions:
+            session_id, session = next(iter(self.sessions.items()))
+            if session.last_used > cutoff:
+                break
+            del self.sessions[session_id]
+            evicted += 1
+        return evicted
+
+    async def _evict_periodically(self):
+        while True:
+            await asyncio.sleep(min(self._idle_timeout / 2, 60))
+            self.evict_idle()
+
+    async def serve(self, host="127.0.0.1", port=8765, started=None):
+        """
+        Serves clients until cancelled.
+
+        Args:
+            host: The interface to listen on.
+            port: The port to listen on, or 0 to pick a free one.
+            started: Optionally a callable that is passed the listening
+                asyncio server once it has started.
+        """
+        server = await asyncio.start_server(
+            self.handle, host, port, limit=MAX_LINE_LENGTH)
+        eviction = asyncio.ensure_future(self._evict_periodically())
+        if started is not None:
+            started(server)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            eviction.cancel()
@@ -0,0 +1,155 @@
+import os
+import time
+from collections import Counter, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from pywordle.game import Status
+
+# The outcome of one simulated game.
+GameRecord = namedtuple("GameRecord", ["solution", "guesses", "won", "seconds"])
+
+# How many chunks of games each worker process gets, so that workers that
+# finish early can pick up more work.
+_CHUNKS_PER_WORKER = 4
+
+# State shared by every chunk played in a worker process.
+_worker = None
+
+
+class SimulationResult:
+    """The aggregated outcome of simulating many games."""
+
+    def __init__(self, games, seconds):
+        """
+        Args:
+            games: A list of GameRecord instances.
+            seconds: The wall clock time taken by the whole simulation.
+        """
+        self.games = games
+        self.seconds = seconds
+
+        # Map from the number of guesses to how many games were won in that
+        # many guesses.
+        self.distribution = Counter(g.guesses for g in games if g.won)
+        self.wins = sum(self.distribution.values())
+
+    @property
+    def win_rate(self):
+        """
+        Returns:
+            The fraction of games that were won.
+        """
+        return self.wins / len(self.games) if self.games else 0.0
+
+    @property
+    def mean_guesses(self):
+        """
+        Returns:
+            The average number of guesses in the games that were won.
+        """
+        if not self.wins:
+            return 0.0
+        total = sum(n * count for n, count in self.distribution.items())
+        return total / self.wins
+
+    @property
+    def mean_game_seconds(self):
+        """
+        Returns:
+            The average time taken to play one game.
+        """
+        if not self.games:
+            return 0.0
+        return sum(g.seconds for g in self.games) / len(self.games)
+
+    def __repr__(self):
+        return "SimulationResult({0} games, {1:.1%} won, {2:.3f} guesses)" \
+            .format(len(self.games), self.win_rate, self.mean_guesses)
+
+
+def play(wordle, strategy, solution, hard_mode=False, max_guesses=None):
+    """
+    Plays one game to the end.
+
+    Args:
+        wordle: The Wordle to start the game from.
+        strategy: A callable taking a Game and returning the next guess.
+        solution: The solution for the game.
+        hard_mode: True if previous known letters must be used.
+        max_guesses: The number of guesses allowed.
+
+    Returns:
+        A GameRecord instance.
+    """
+    start = time.perf_counter()
+    game = wordle.start_game(hard_mode, solution, max_guesses)
+    guesses = 0
+    while game.get_status() == Status.IN_PROGRESS:
+        game.guess(strategy(game))
+        guesses += 1
+    return GameRecord(solution, guesses, game.get_status() == Status.WON,
+                      time.perf_counter() - start)
+
+
+def _init_worker(wordle, strategy, hard_mode, max_guesses):
+    global _worker
+    _worker = (wordle, strategy, hard_mode, max_guesses)
+
+
+def _play_chunk(solutions):
+    wordle, strategy, hard_mode, max_guesses = _worker
+    return [play(wordle, strategy, solution, hard_mode, max_guesses)
+            for solution in solutions]
+
+
+def simulate(wordle, strategy, solutions=None, hard_mode=False,
+             max_guesses=None, workers=None, chunk_size=None):
+    """
+    Plays a game for every solution with a strategy, spread over a pool of
+    worker processes.
+
+    The strategy must be picklable, such as a module level function or
+    Solver.best_guess. The Wordle is sent to each worker once: its dictionary
+    is the worker's own shared dictionary and a memory-mapped pattern table
+    is mapped again by each worker, so the table is shared by all of them.
+
+    Args:
+        wordle: The Wordle to start games from.
+        strategy: A callable taking a Game and returning the next guess.
+        solutions: The solutions to play. Defaults to every solution of the
+            Wordle.
+        hard_mode: True if previous known letters must be used.
+        max_guesses: The number of guesses allowed.
+        workers: The number of worker processes. Defaults to the number of
+            CPUs. With a single worker games are played in this process.
+        chunk_size: The number of games sent to a worker at a time.
+
+    Returns:
+        A SimulationResult instance.
+    """
+    solutions = list(wordle.solutions if solutions is None else solutions)
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+
+    if workers == 1:
+        games = [play(wordle, strategy, solution, hard_mode, max_guesses)
+                 for solution in solutions]
+        return SimulationResult(games, time.perf_counter() - start)
+
+    # Build the shared structures before starting workers so that they are
+    # inherited or mapped rather than built by every worker.
+    wordle.dictionary.build_index()
+    wordle.patterns
+
+    chunk_size = chunk_size or max(
+        1, -(-len(solutions) // (workers * _CHUNKS_PER_WORKER)))
+    chunks = [solutions[i:i + chunk_size]
+              for i in range(0, len(solutions), chunk_size)]
+
+    games = []
+    with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker,
+            initargs=(wordle, strategy, hard_mode, max_guesses)) as executor:
+        for records in executor.map(_play_chunk, chunks):
+            games.extend(records)
+    return SimulationResult(games, time.perf_counter() - start)
@@ -0,0 +1,278 @@
+import heapq
+import math
+from collections import Counter
+
+from pywordle.dictionary import bit_indices
+from pywordle.feedback import WordArray, load_numpy, score, score_guesses, \
+    score_many
+from pywordle.patterns import count_buckets
+
+# The most candidate sets each solver remembers the scores of.
+_CACHE_SIZE = 16
+
+# How many guesses' bucket counts are weighted at once.
+_BLOCK_SIZE = 256
+
+
+def _entropies(counts, n_candidates):
+    """
+    Args:
+        counts: A NumPy array with one row per guess of how many candidates
+            get each pattern.
+        n_candidates: The number of candidates.
+
+    Returns:
+        The expected information, in bits, revealed by each guess.
+    """
+    np = load_numpy()
+
+    # n * log2(n) for every bucket size that can occur.
+    sizes = np.arange(n_candidates + 1, dtype=np.float64)
+    sizes[0] = 1
+    weighted = sizes * np.log2(sizes)
+
+    # Summing the weights block by block keeps them in the CPU cache.
+    totals = np.empty(len(counts), dtype=np.float64)
+    for start in range(0, len(counts), _BLOCK_SIZE):
+        block = counts[start:start + _BLOCK_SIZE]
+        totals[start:start + len(block)] = np.take(weighted, block).sum(
+            axis=1)
+    return math.log2(n_candidates) - totals / n_candidates
+
+
+def _bit_array(np, mask):
+    """
+    Returns:
+        The positions of the words in a bitset of words, in order, as a
+        NumPy array.
+    """
+    data = np.frombuffer(
+        mask.to_bytes((mask.bit_length() + 7) // 8, "little"), dtype=np.uint8)
+    return np.flatnonzero(np.unpackbits(data, bitorder="little"))
+
+
+def _candidate_counts(table, columns):
+    """
+    Args:
+        table: A PatternTable.
+        columns: The distinct columns of the candidates in the table.
+
+    Returns:
+        A NumPy array with one row per guess of how many candidates get each
+        pattern.
+    """
+    np = load_numpy()
+    n_solutions = table.n_solutions
+    if len(columns) == n_solutions:
+        return table.bucket_counts()
+
+    if 2 * len(columns) <= n_solutions:
+        return count_buckets(table.array(), np.sort(columns))
+
+    # Most solutions are candidates, so it's quicker to count the rest and
+    # take them away from the counts of every solution.
+    rest = np.ones(n_solutions, dtype=bool)
+    rest[columns] = False
+    return table.bucket_counts() - \
+        count_buckets(table.array(), np.flatnonzero(rest))
+
+
+def _entropy(patterns, n_candidates):
+    """
+    Returns:
+        The expected information, in bits, revealed by a guess with the given
+        pattern for each candidate.
+    """
+    total = sum(n * math.log2(n) for n in Counter(patterns).values())
+    return math.log2(n_candidates) - total / n_candidates
+
+
+class Solver:
+    """Suggests the guesses expected to narrow down a game the most."""
+
+    def __init__(self, wordle, opening_book=None):
+        """
+        Args:
+            wordle: The Wordle the games were started from. Its pattern table
+                is used to score guesses against the remaining solutions.
+            opening_book: Optionally an OpeningBook for the Wordle, which
+                best_guess looks the first two guesses up in.
+        """
+        self._wordle = wordle
+        self._opening_book = opening_book
+        self._dictionary = wordle.dictionary
+
+        # Bitset of the solutions that are in the dictionary, and the column
+        # of each of them in the pattern table.
+        self._solution_mask = 0
+        self._columns = {}
+        for column, word in enumerate(wordle.solutions):
+            i = self._dictionary.index(word)
+            if i is not None:
+                self._solution_mask |= 1 << i
+                self._columns[i] = column
+
+        # Map from a set of candidates to the score of every guess.
+        self._scores = {}
+
+        # The letters of every guess, for scoring candidates that aren't in
+        # the pattern table. Built when first needed.
+        self._guesses = None
+
+        # NumPy is imported now rather than by the first ranking, so that
+        # the first hint is as quick as the rest.
+        load_numpy()
+
+    def __reduce__(self):
+        # Scores are cheap to recompute compared to sending them around.
+        return (Solver, (self._wordle, self._opening_book))
+
+    def rank(self, game, limit=10):
+        """
+        Ranks the valid guesses by how much they are expected to narrow down
+        the possible solutions.
+
+        Args:
+            game: A game started from this solver's Wordle.
+            limit: The number of guesses to return, or None for all of them.
+
+        Returns:
+            A list of (guess, bits) pairs, best first, where bits is the
+            expected information revealed by the guess. Ties are broken in
+            favor of guesses that might be the solution.
+        """
+        return self.rank_bitsets(game.candidates, game.allowed, limit)
+
+    def rank_bitsets(self, possible, allowed, limit=10):
+        """
+        Ranks guesses like rank, from bitsets of a game's words rather than
+        the game, so that a snapshot of them can be ranked while the game
+        carries on.
+
+        Args:
+            possible: The bitset of words that might be the solution.
+            allowed: The bitset of words that are valid guesses.
+            limit: The number of guesses to return, or None for all of them.
+
+        Returns:
+            A list of (guess, bits) pairs, best first.
+        """
+        candidates = possible & self._solution_mask
+        if not candidates:
+            # The solution isn't one of the Wordle's solutions, so fall back
+            # to every valid word that's still possible.
+            candidates = possible
+        if not candidates:
+            return []
+
+        np = load_numpy()
+        if np is not None:
+            indices = _bit_array(np, candidates)
+            scores = self.entropies(candidates, indices.tolist())
+            guesses = _bit_array(np, allowed)
+
+            # Sort by score, then candidates first, then dictionary order.
+            possible = np.zeros(len(self._dictionary), dtype=bool)
+            possible[indices] = True
+            ranking = guesses[np.lexsort(
+                (guesses, ~possible[guesses], -scores[guesses]))]
+            if limit is not None:
+                ranking = ranking[:limit]
+            return [(self._dictionary[i], float(scores[i]))
+                    for i in ranking.tolist()]
+
+        indices = bit_indices(candidates)
+        scores = self.entropies(candidates, indices)
+
+        guesses = bit_indices(allowed)
+
+        candidate_set = set(indices)
+
+        def order(i):
+            return -scores[i], i not in candidate_set, i
+
+        if limit is None:
+            ranking = sorted(guesses, key=order)
+        else:
+            ranking = heapq.nsmallest(limit, guesses, key=order)
+        return [(self._dictionary[i], float(scores[i])) for i in ranking]
+
+    def best_guess(self, game):
+        """
+        Returns:
+            The guess expected to narrow down the game the most, or None if
+            no valid word can be the solution.
+        """
+        if self._opening_book is not None:
+            guess = self._opening_book.lookup(game)
+            if guess is not None:
+                return guess
+
+        ranking = self.rank(game, limit=1)
+        return ranking[0][0] if ranking else None
+
+    def entropies(self, candidates, indices=None):
+        """
+        Args:
+            candidates: A bitset of the words in the dictionary that might be
+                the solution.
+            indices: The positions of the candidates, if already known.
+
+        Returns:
+            The expected information, in bits, revealed by each guess in the
+            dictionary, indexed by dictionary position.
+        """
+        scores = self._scores.get(candidates)
+        if scores is None:
+            if indices is None:
+                indices = bit_indices(candidates)
+            in_table = candidates & self._solution_mask == candidates
+            scores = self._score(indices, in_table)
+            if len(self._scores) >= _CACHE_SIZE:
+                self._scores.clear()
+            self._scores[candidates] = scores
+        return scores
+
+    def _score(self, indices, in_table):
+        """
+        Args:
+            indices: The dictionary positions of the remaining candidates.
+            in_table: Whether every candidate is a column of the table.
+
+        Returns:
+            The expected information revealed by each guess in the
+            dictionary.
+        """
+        np = load_numpy()
+        words = self._dictionary.words
+        candidates = [words[i] for i in indices]
+
+        if np is None:
+            if in_table:
+                columns = [self._columns[i] for i in indices]
+                table = self._wordle.patterns
+                return [
+                    _entropy([table.pattern(g, c) for c in columns],
+                             len(indices))
+                    for g in range(len(words))]
+            return [
+                _entropy([score(guess, c) for c in candidates], len(indices))
+                for guess in words]
+
+        if in_table:
+            columns = np.array([self._columns[i] for i in indices],
+                               dtype=np.intp)
+            counts = _candidate_counts(self._wordle.patterns, columns)
+        else:
+            # Score in whichever direction takes fewer batches.
+            if len(candidates) < len(words):
+                if self._guesses is None:
+                    self._guesses = WordArray(words)
+                table = np.stack([score_guesses(self._guesses, candidate)
+                                  for candidate in candidates], axis=1)
+            else:
+                targets = WordArray(candidates)
+                table = np.stack([score_many(guess, targets)
+                                  for guess in words])
+            counts = count_buckets(table)
+        return _entropies(counts, len(indices))
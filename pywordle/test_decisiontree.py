@@ -0,0 +1,85 @@
+import os
+import pickle
+import unittest
+
+from decisiontree import (DecisionTree, build_decision_tree,
+                          cached_decision_tree, decision_tree_key)
+from testutil import WORDS, temp_wordle
+
+SOLUTIONS = ["SPILL", "SKILL", "STILL", "SHILL", "SWILL", "RAISE"]
+
+
+class TestDecisionTree(unittest.TestCase):
+
+    def setUp(self):
+        self.wordle, self.tmp_dir = temp_wordle(self, SOLUTIONS)
+
+    def test_solves_every_solution(self):
+        tree = build_decision_tree(self.wordle, workers=1)
+
+        self.assertEqual(tree.guess_at(0), "STICK")
+        for solution in SOLUTIONS:
+            guesses = tree.play(solution)
+            self.assertEqual(guesses[-1], solution)
+            self.assertLessEqual(len(guesses), 4)
+
+    def test_lookahead(self):
+        greedy = build_decision_tree(self.wordle, workers=1)
+        deeper = build_decision_tree(self.wordle, lookahead=3, workers=1)
+
+        def total(tree):
+            return sum(len(tree.play(s)) for s in SOLUTIONS)
+
+        self.assertLessEqual(total(deeper), total(greedy))
+
+    def test_workers(self):
+        tree = build_decision_tree(self.wordle, workers=2)
+
+        for solution in SOLUTIONS:
+            self.assertEqual(tree.play(solution)[-1], solution)
+
+    def test_next_guess(self):
+        tree = build_decision_tree(self.wordle, workers=1)
+        game = self.wordle.start_game(solution="SKILL")
+
+        self.assertEqual(tree.next_guess(game), "STICK")
+        game.guess("STICK")
+        self.assertEqual(tree.next_guess(game), "SKILL")
+
+        game = self.wordle.start_game(solution="SKILL")
+        game.guess("SWORD")
+        self.assertIsNone(tree.next_guess(game))
+        self.assertIsNone(tree.next_guess(self.wordle.start_game(True)))
+
+    def test_child(self):
+        tree = build_decision_tree(self.wordle, workers=1)
+
+        # STICK against SKILL
+        self.assertIsNotNone(tree.child(0, 2 + 18 + 81))
+        self.assertIsNone(tree.child(0, 242))
+
+    def test_cached_decision_tree(self):
+        tree = cached_decision_tree(self.wordle, workers=1,
+                                    cache_dir=self.tmp_dir)
+        self.assertIsNotNone(tree.path)
+
+        cached = cached_decision_tree(self.wordle, workers=1,
+                                      cache_dir=self.tmp_dir)
+        self.assertEqual(len(cached), len(tree))
+        for solution in SOLUTIONS:
+            self.assertEqual(cached.play(solution), tree.play(solution))
+
+        restored = pickle.loads(pickle.dumps(cached))
+        self.assertEqual(restored.play("SWILL"), cached.play("SWILL"))
+
+    def test_open_rejects_other_words(self):
+        path = os.path.join(self.tmp_dir, "tree.bin")
+        build_decision_tree(self.wordle, workers=1).save(path)
+
+        other = decision_tree_key(WORDS, SOLUTIONS[:2], 1)
+        self.assertRaises(Exception, DecisionTree.open, path,
+                          self.wordle.dictionary, other)
+
+
+if __name__ == "__main__":
+    unittest.main()
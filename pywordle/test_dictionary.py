@@ -0,0 +1,98 @@
+import unittest
+
+from dictionary import Dictionary, DICTIONARY, popcount
+from feedback import load_numpy, score
+
+
+class TestDictionary(unittest.TestCase):
+
+    def test_contains(self):
+        dictionary = Dictionary(["RAISE", "treat"])
+
+        self.assertIn("RAISE", dictionary)
+        self.assertIn("Treat", dictionary)
+        self.assertNotIn("SPOIL", dictionary)
+
+    def test_index(self):
+        dictionary = Dictionary(["RAISE", "TREAT", "SPOIL"])
+
+        self.assertEqual(dictionary.index("spoil"), 2)
+        self.assertEqual(dictionary[1], "TREAT")
+        self.assertIsNone(dictionary.index("AAAAA"))
+
+    def test_words_are_ordered(self):
+        dictionary = Dictionary(["RAISE", "TREAT", "SPOIL"])
+
+        self.assertEqual(list(dictionary), ["RAISE", "TREAT", "SPOIL"])
+        self.assertEqual(len(dictionary), 3)
+
+    def test_match_mask(self):
+        dictionary = Dictionary(["SPILL", "STILL", "FOILS", "SKILL"])
+
+        mask = dictionary.match_mask("STILL", score("STILL", "SPILL"))
+
+        self.assertEqual(mask, 0b1001)
+        self.assertEqual(dictionary.words_in(mask), ["SPILL", "SKILL"])
+        self.assertEqual(popcount(mask), 2)
+
+    def test_position_mask(self):
+        dictionary = Dictionary(["SPILL", "STILL", "FOILS", "SKILL"])
+
+        self.assertEqual(dictionary.position_mask(0, "S"), 0b1011)
+        self.assertEqual(dictionary.position_mask(4, "S"), 0b0100)
+        self.assertEqual(dictionary.position_mask(2, "Z"), 0)
+
+    def test_count_mask(self):
+        dictionary = Dictionary(["SPILL", "STILL", "FOILS", "SKILL"])
+
+        self.assertEqual(dictionary.count_mask("L", 1), 0b1111)
+        self.assertEqual(dictionary.count_mask("L", 2), 0b1011)
+        self.assertEqual(dictionary.count_mask("L", 3), 0)
+        self.assertEqual(dictionary.count_mask("Z", 1), 0)
+        self.assertEqual(dictionary.count_mask("Z", 0), 0b1111)
+
+    def test_match_mask_duplicate_letters(self):
+        dictionary = Dictionary(["SPILL", "STILL", "FOILS", "SKILL"])
+
+        # The absent second L rules out words with two Ls.
+        mask = dictionary.match_mask("LLAMA", score("LLAMA", "FOILS"))
+
+        self.assertEqual(dictionary.words_in(mask), ["FOILS"])
+
+    @unittest.skipIf(load_numpy() is None, "NumPy is not installed")
+    def test_numpy_index_matches_python_index(self):
+        python = Dictionary(DICTIONARY.words)
+        python.build_index(use_numpy=False)
+        numpy = Dictionary(DICTIONARY.words)
+        numpy.build_index(use_numpy=True)
+
+        self.assertEqual(numpy._position_masks, python._position_masks)
+        self.assertEqual(numpy._count_masks, python._count_masks)
+
+    def test_index_falls_back_to_python_for_other_letters(self):
+        dictionary = Dictionary(["SPILL", "ST1LL", "FOÏLS"])
+        dictionary.build_index(use_numpy=True)
+
+        self.assertEqual(dictionary.position_mask(2, "1"), 0b010)
+        self.assertEqual(dictionary.count_mask("Ï", 1), 0b100)
+
+    def test_words_in(self):
+        dictionary = Dictionary(["RAISE", "TREAT", "SPOIL"])
+
+        self.assertEqual(dictionary.words_in(dictionary.all_mask),
+                         ["RAISE", "TREAT", "SPOIL"])
+        self.assertEqual(dictionary.words_in(0b100), ["SPOIL"])
+        self.assertEqual(dictionary.words_in(0), [])
+
+    def test_shared_dictionary(self):
+        self.assertEqual(len(DICTIONARY), 12972)
+        self.assertIn("SPILL", DICTIONARY)
+
+    def test_repr(self):
+        dictionary = Dictionary(["RAISE"])
+
+        self.assertEqual(repr(dictionary), "Dictionary(1 words)")
+
+
+if __name__ == '__main__':
+    unittest.main()
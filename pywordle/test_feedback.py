@@ -0,0 +1,62 @@
+import unittest
+
+from feedback import (ABSENT, PRESENT, CORRECT, SOLVED, WordArray, decode,
+                      load_numpy, score, score_guesses, score_many)
+
+WORDS = ["SPILL", "LLAMA", "FOILS", "EERIE", "TREAT", "ALLEE"]
+
+
+class TestFeedback(unittest.TestCase):
+
+    def test_score(self):
+        self.assertEqual(score("SPILL", "SPILL"), SOLVED)
+        self.assertEqual(score("TREAT", "SPILL"), 0)
+        self.assertEqual(
+            decode(score("FOILS", "SPILL")),
+            (ABSENT, ABSENT, CORRECT, CORRECT, PRESENT))
+
+    def test_score_duplicate_letters(self):
+        # Only one of the guessed Ls is in the solution.
+        self.assertEqual(
+            decode(score("LLAMA", "FOILS")),
+            (PRESENT, ABSENT, ABSENT, ABSENT, ABSENT))
+        # The exact match takes priority over the earlier inexact match.
+        self.assertEqual(
+            decode(score("LLAMA", "ALOFT")),
+            (ABSENT, CORRECT, PRESENT, ABSENT, ABSENT))
+        self.assertEqual(
+            decode(score("SKILL", "LLAMA")),
+            (ABSENT, ABSENT, ABSENT, PRESENT, PRESENT))
+        self.assertEqual(
+            decode(score("EERIE", "ALLEE")),
+            (PRESENT, ABSENT, ABSENT, ABSENT, CORRECT))
+
+    def test_score_many(self):
+        for guess in WORDS:
+            expected = [score(guess, solution) for solution in WORDS]
+
+            self.assertListEqual(list(score_many(guess, WORDS)), expected)
+
+    @unittest.skipIf(load_numpy() is None, "NumPy is not installed")
+    def test_score_many_word_array(self):
+        solutions = WordArray(WORDS)
+
+        for guess in WORDS:
+            expected = [score(guess, solution) for solution in WORDS]
+
+            self.assertListEqual(list(score_many(guess, solutions)), expected)
+        self.assertEqual(solutions.letters.shape, (6, 5))
+
+    @unittest.skipIf(load_numpy() is None, "NumPy is not installed")
+    def test_score_guesses(self):
+        guesses = WordArray(WORDS)
+
+        for solution in WORDS:
+            expected = [score(guess, solution) for guess in WORDS]
+
+            self.assertListEqual(list(score_guesses(guesses, solution)),
+                                 expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,7 @@ import unittest
 
 from termcolor import colored
 
+from feedback import ABSENT, CORRECT, PRESENT, decode
 from game import Game, Status
 
 
@@ -12,18 +13,26 @@ class TestGame(unittest.TestCase):
 
         game.guess("SLITS")
 
-        self.assertDictEqual(game._correct_letters, {"I": {2}})
+        (guess, pattern), = game.constraints
+        self.assertEqual(guess, "SLITS")
+        self.assertEqual(decode(pattern),
+                         (ABSENT, ABSENT, CORRECT, PRESENT, ABSENT))
+        self.assertIn("POINT", game._dictionary.words_in(game.candidates))
 
     def test_guess_handles_casing(self):
         game = Game("pOInt", False)
 
         game.guess("SliTs")
 
-        self.assertDictEqual(game._correct_letters, {"I": {2}})
+        (guess, pattern), = game.constraints
+        self.assertEqual(guess, "SLITS")
+        self.assertEqual(decode(pattern),
+                         (ABSENT, ABSENT, CORRECT, PRESENT, ABSENT))
+        self.assertIn("POINT", game._dictionary.words_in(game.candidates))
 
     def test_guess_hard_mode_exception(self):
         game = Game("POINT", True)
-        game._correct_letters["o"] = [1]
+        game.guess("FOAMS")
 
         self.assertRaises(Exception, game.guess, "TREAT")
 
@@ -46,14 +55,13 @@ class TestGame(unittest.TestCase):
 
     def test_is_valid(self):
         game = Game("CAUSE", False)
-        game._correct_letters = {"A": {1}}
 
         self.assertTrue(game.is_valid("SPILL"))
         self.assertFalse(game.is_valid("AAAAA"))
 
     def test_is_valid_hard_mode(self):
         game = Game("CAUSE", True)
-        game._correct_letters = {"A": {1}}
+        game.guess("BANJO")
 
         self.assertTrue(game.is_valid("TAPER"))
         self.assertTrue(game.is_valid("CAUSE"))
@@ -61,6 +69,31 @@ class TestGame(unittest.TestCase):
         self.assertFalse(game.is_valid("SPILL"))
         self.assertFalse(game.is_valid("AAAAA"))
 
+    def test_is_valid_hard_mode_moved_letters(self):
+        game = Game("CAUSE", True)
+        game.guess("SHORT")
+
+        # The S must be reused, but it can be anywhere.
+        self.assertTrue(game.is_valid("BASTE"))
+        self.assertTrue(game.is_valid("CAUSE"))
+        self.assertFalse(game.is_valid("TAPER"))
+
+    def test_is_valid_hard_mode_letter_counts(self):
+        game = Game("EERIE", True)
+        game.guess("SHEEP")
+
+        # Both Es were revealed, so both must be reused.
+        self.assertTrue(game.is_valid("EERIE"))
+        self.assertTrue(game.is_valid("ENTER"))
+        self.assertFalse(game.is_valid("RAISE"))
+
+    def test_allowed_guesses(self):
+        game = Game("CAUSE", True)
+        game.guess("CAUSA")
+
+        self.assertListEqual(game.allowed_guesses(), ["CAUSA", "CAUSE"])
+        self.assertEqual(len(Game("CAUSE", False).allowed_guesses()), 12972)
+
     def test_get_status_won(self):
         game = Game("CAUSE", False)
 
@@ -91,7 +124,17 @@ class TestGame(unittest.TestCase):
         game.guess("IDIOM")
         game.guess("SPILL")
 
-        self.assertListEqual(game.plot_progress(), [12972, 59, 4, 4, 1])
+        self.assertListEqual(game.plot_progress(), [12972, 15, 4, 4, 1])
+
+    def test_words_left(self):
+        game = Game("SPILL", False)
+
+        game.guess("FOILS")
+        game.guess("SWIRL")
+
+        self.assertListEqual(
+            game.words_left, ["SHILL", "SKILL", "SPILL", "STILL"])
+        self.assertEqual(game.progress[-1], 4)
 
     def test_str(self):
         game = Game("SPILL", False)
@@ -130,11 +173,180 @@ class TestGame(unittest.TestCase):
                 colored("L", "grey", "on_green") +
                 colored("L", "grey", "on_green")
             ),
+            colored(" ", "grey", "on_white") * 5,
+            colored(" ", "grey", "on_white") * 5,
         ])
 
         self.maxDiff = None
         self.assertEqual(str(game), expected)
 
+    def test_str_updates_after_guess(self):
+        game = Game("SPILL", False, 2)
+        blank_row = colored(" ", "grey", "on_white") * 5
+
+        self.assertEqual(str(game), blank_row + "\n" + blank_row)
+
+        game.guess("SPILL")
+
+        self.assertEqual(
+            str(game),
+            colored("S", "grey", "on_green") +
+            colored("P", "grey", "on_green") +
+            colored("I", "grey", "on_green") +
+            colored("L", "grey", "on_green") +
+            colored("L", "grey", "on_green") + "\n" + blank_row)
+
+    def test_guess_many(self):
+        solutions = ["SPILL", "STILL", "POINT", "SPILL"]
+        games = [Game(solution, False) for solution in solutions]
+        expected = [Game(solution, False) for solution in solutions]
+
+        results = Game.guess_many(games, "still")
+
+        self.assertEqual([int(p) for p in results.patterns],
+                         [game.guess("STILL") for game in expected])
+        self.assertEqual([Status(int(s)) for s in results.statuses],
+                         [game.get_status() for game in expected])
+        self.assertEqual([int(n) for n in results.left],
+                         [game.progress[-1] for game in expected])
+        for game, other in zip(games, expected):
+            self.assertEqual(game.get_status(), other.get_status())
+            self.assertEqual(game.candidates, other.candidates)
+            self.assertEqual(game.progress, other.progress)
+            self.assertEqual(str(game), str(other))
+        self.assertEqual(games[1].get_status(), Status.WON)
+
+    def test_guess_many_invalid(self):
+        games = [Game("SPILL", False), Game("POINT", True)]
+        games[1].guess("FOAMS")
+
+        self.assertRaises(Exception, Game.guess_many, games, "STILL")
+        self.assertRaises(Exception, Game.guess_many, games[:1], "ZZZZZ")
+        self.assertEqual(games[0].progress, [len(games[0].allowed_guesses())])
+
+        games[0].guess("SPILL")
+        self.assertRaises(Exception, Game.guess_many, games[:1], "STILL")
+
+    def test_guess_many_duplicate_games(self):
+        game = Game("SPILL", False, 1)
+
+        self.assertRaises(Exception, Game.guess_many, [game, game], "RAISE")
+        self.assertEqual(game.progress, [len(game.allowed_guesses())])
+        self.assertEqual(game.get_status(), Status.IN_PROGRESS)
+
+    def test_undo_redo(self):
+        game = Game("POINT", True)
+        game.guess("FOAMS")
+        before = (game.progress, game.candidates, game.allowed, str(game))
+        pattern = game.guess("BOINK")
+        after = (game.progress, game.candidates, game.allowed, str(game))
+
+        self.assertEqual(game.undo(), "BOINK")
+        self.assertEqual(game.constraints, [("FOAMS", 6)])
+        self.assertEqual(
+            (game.progress, game.candidates, game.allowed, str(game)), before)
+
+        self.assertEqual(game.redo(), pattern)
+        self.assertEqual(
+            (game.progress, game.candidates, game.allowed, str(game)), after)
+
+    def test_undo_win(self):
+        game = Game("POINT", False)
+        game.guess("FOAMS")
+        game.guess("POINT")
+
+        game.undo()
+        self.assertEqual(game.get_status(), Status.IN_PROGRESS)
+        game.redo()
+        self.assertEqual(game.get_status(), Status.WON)
+
+    def test_guess_forgets_undone_guesses(self):
+        game = Game("POINT", False)
+        game.guess("FOAMS")
+        game.undo()
+        game.guess("BOINK")
+
+        self.assertRaises(Exception, game.redo)
+        self.assertEqual(game.undo(), "BOINK")
+        self.assertRaises(Exception, game.undo)
+
+    def test_undo_after_restore(self):
+        game = Game("POINT", True)
+        game.guess("FOAMS")
+        expected = (game.progress, game.candidates, game.allowed)
+        game.guess("BOINK")
+
+        restored = Game.from_bytes(game.to_bytes())
+        restored.undo()
+        self.assertEqual(
+            (restored.progress, restored.candidates, restored.allowed),
+            expected)
+
+    def test_snapshot(self):
+        game = Game("POINT", True, 8)
+        game.guess("FOAMS")
+        game.guess("BOINK")
+
+        data = game.to_bytes()
+        self.assertEqual(len(data), 10)
+
+        restored = Game.from_bytes(data)
+        self.assertEqual(restored.get_status(), Status.IN_PROGRESS)
+        self.assertEqual(restored.candidates, game.candidates)
+        self.assertEqual(restored.progress, game.progress)
+        self.assertEqual(str(restored), str(game))
+        self.assertFalse(restored.is_valid("TREAT"))
+
+        restored.guess("POINT")
+        self.assertEqual(restored.get_status(), Status.WON)
+        self.assertEqual(Game.from_bytes(restored.to_bytes()).get_status(),
+                         Status.WON)
+
+    def test_snapshot_guess_after_restore(self):
+        game = Game("POINT", False)
+        game.guess("FOAMS")
+        game.guess("BOINK")
+
+        restored = Game.from_bytes(game.to_bytes())
+        restored.guess("JOINT")
+        game.guess("JOINT")
+
+        self.assertEqual(restored.progress, game.progress)
+        self.assertEqual(str(restored), str(game))
+
+    def test_snapshot_solution_not_in_dictionary(self):
+        game = Game("ZZZZZ", False, 1)
+        game.guess("SPILL")
+
+        restored = Game.from_bytes(game.to_bytes())
+        self.assertEqual(repr(restored), "Game(\"ZZZZZ\", False)")
+        self.assertEqual(restored.get_status(), Status.LOST)
+
+    def test_snapshot_malformed(self):
+        data = Game("POINT", False).to_bytes()
+
+        self.assertRaises(Exception, Game.from_bytes, data[:3])
+        self.assertRaises(Exception, Game.from_bytes, b"\xff" + data[1:])
+        self.assertRaises(Exception, Game.from_bytes, data[:3] + b"\x01" +
+                          data[4:])
+
+    def test_snapshot_too_many_guesses(self):
+        game = Game("POINT", False, 2)
+        game.guess("FOAMS")
+        game.guess("BOINK")
+        data = game.to_bytes()
+
+        # Two guesses can't have been made in a game of one guess.
+        self.assertRaises(Exception, Game.from_bytes,
+                          data[:2] + b"\x01" + data[3:])
+
+    def test_snapshot_trailing_bytes(self):
+        game = Game("POINT", False)
+        game.guess("FOAMS")
+
+        self.assertRaises(Exception, Game.from_bytes,
+                          game.to_bytes() + b"XYZ")
+
     def test_repr(self):
         game = Game("BOAST", True)
 
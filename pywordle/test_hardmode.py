@@ -0,0 +1,44 @@
+import unittest
+
+from dictionary import Dictionary
+from feedback import score
+from hardmode import HardMode
+
+WORDS = ["SPILL", "STILL", "SLITS", "FOILS", "LILTS", "TREAT"]
+
+
+class TestHardMode(unittest.TestCase):
+
+    def test_update(self):
+        dictionary = Dictionary(WORDS)
+        hints = HardMode(dictionary)
+
+        hints.update("SLITS", score("SLITS", "SPILL"))
+
+        self.assertDictEqual(hints.correct, {0: "S", 2: "I"})
+        self.assertDictEqual(dict(hints.required), {"S": 1, "L": 1, "I": 1})
+        self.assertListEqual(
+            dictionary.words_in(hints.allowed), ["SPILL", "STILL", "SLITS"])
+
+    def test_update_only_narrows(self):
+        dictionary = Dictionary(WORDS)
+        hints = HardMode(dictionary)
+
+        hints.update("FOILS", score("FOILS", "SPILL"))
+        hints.update("TREAT", score("TREAT", "SPILL"))
+
+        self.assertListEqual(
+            dictionary.words_in(hints.allowed), ["SPILL", "STILL", "FOILS"])
+
+    def test_is_allowed(self):
+        hints = HardMode(Dictionary(WORDS))
+        hints.update("LILTS", score("LILTS", "SPILL"))
+
+        # Both Ls were revealed, so both must be reused.
+        self.assertTrue(hints.is_allowed("SPILL"))
+        self.assertFalse(hints.is_allowed("FOILS"))
+        self.assertFalse(hints.is_allowed("AAAAA"))
+
+
+if __name__ == '__main__':
+    unittest.main()
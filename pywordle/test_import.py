@@ -0,0 +1,55 @@
+import os
+import subprocess
+import sys
+import unittest
+
+# Importing the package in a fresh interpreter must stay under this many
+# seconds. Optional dependencies like matplotlib and NumPy each take longer
+# than this on their own.
+IMPORT_BUDGET = 0.15
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MEASURE_IMPORT = """
+import sys
+import time
+
+start = time.perf_counter()
+import pywordle
+print(time.perf_counter() - start)
+print(",".join(sorted(sys.modules)))
+"""
+
+
+def import_pywordle():
+    """
+    Returns:
+        The seconds taken to import pywordle and the modules it loaded.
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [ROOT, env.get("PYTHONPATH")]))
+    output = subprocess.run(
+        [sys.executable, "-c", MEASURE_IMPORT],
+        env=env, check=True, stdout=subprocess.PIPE,
+        universal_newlines=True).stdout.split("\n")
+    return float(output[0]), set(output[1].split(","))
+
+
+class TestImport(unittest.TestCase):
+
+    def test_import_skips_optional_dependencies(self):
+        _, modules = import_pywordle()
+
+        self.assertNotIn("matplotlib", modules)
+        self.assertNotIn("numpy", modules)
+
+    def test_import_time(self):
+        # Take the best of a few runs to smooth out noise from the machine.
+        seconds = min(import_pywordle()[0] for _ in range(3))
+
+        self.assertLess(seconds, IMPORT_BUDGET)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+
+from game import Game, metrics
+from wordle import Wordle
+
+
+class TestMetrics(unittest.TestCase):
+
+    def tearDown(self):
+        metrics.disable()
+
+    def test_disabled(self):
+        game = Game("POINT", False)
+        game.guess("SLITS")
+
+        self.assertIsNone(metrics.active)
+
+    def test_guess(self):
+        collector = metrics.enable()
+        game = Game("POINT", True)
+        game.guess("SLITS")
+        self.assertRaises(Exception, game.guess, "AAAAA")
+
+        measured = collector.as_dict()
+        self.assertEqual(measured["counters"], {
+            "guesses": 1, "invalid_guesses": 1, "candidates_examined": 12972})
+        self.assertEqual(set(measured["timers"]), {
+            "guess.validate", "guess.score", "guess.constrain",
+            "guess.filter"})
+
+    def test_same_state_as_uninstrumented(self):
+        game = Game("POINT", True)
+        game.guess("SLITS")
+        with metrics.collect():
+            measured = Game("POINT", True)
+            measured.guess("SLITS")
+
+        self.assertEqual(measured.candidates, game.candidates)
+        self.assertEqual(measured.allowed, game.allowed)
+        self.assertEqual(measured.progress, game.progress)
+
+    def test_render(self):
+        game = Game("POINT", False)
+        with metrics.collect() as collector:
+            str(game)
+            str(game)
+            game.guess("SLITS")
+            str(game)
+
+        self.assertEqual(collector.counters["renders"], 3)
+        self.assertIn("render", collector.timers)
+        self.assertIsNone(metrics.active)
+
+    def test_wordle(self):
+        with metrics.collect() as collector:
+            Wordle(["POINT"]).start_game()
+
+        self.assertEqual(collector.counters["games_started"], 1)
+
+    def test_callback(self):
+        events = []
+        metrics.enable(lambda name, value: events.append(name))
+        Game("POINT", False).guess("SLITS")
+
+        self.assertEqual(events, [
+            "guess.validate", "guess.score", "guess.constrain",
+            "candidates_examined", "guess.filter", "guesses"])
+
+    def test_reset(self):
+        collector = metrics.enable()
+        Game("POINT", False).guess("SLITS")
+        collector.reset()
+
+        self.assertEqual(collector.as_dict(), {"counters": {}, "timers": {}})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import unittest
+
+from termcolor import colored
+
+from multigame import MultiGame, Status
+
+
+def green(word):
+    return "".join(colored(letter, "grey", "on_green") for letter in word)
+
+
+class TestMultiGame(unittest.TestCase):
+
+    def test_guess(self):
+        game = MultiGame(["SPILL", "POINT", "RAISE", "TREAT"])
+
+        patterns = game.guess("spill")
+
+        self.assertEqual(patterns[0], 242)
+        self.assertEqual(patterns[2], 19)
+        self.assertEqual(game.get_status(0), Status.WON)
+        self.assertEqual(game.get_status(1), Status.IN_PROGRESS)
+        self.assertEqual(game.get_status(), Status.IN_PROGRESS)
+
+    def test_solved_board_is_not_narrowed(self):
+        game = MultiGame(["SPILL", "POINT"])
+        game.guess("SPILL")
+        game.guess("RAISE")
+
+        self.assertEqual(game.words_left(0), ["SPILL"])
+        self.assertNotIn("SPILL", game.words_left(1))
+        self.assertIn("POINT", game.words_left(1))
+
+    def test_won(self):
+        game = MultiGame(["SPILL", "POINT"])
+        game.guess("POINT")
+        game.guess("SPILL")
+
+        self.assertEqual(game.get_status(), Status.WON)
+        self.assertRaises(Exception, game.guess, "RAISE")
+
+    def test_lost(self):
+        game = MultiGame(["SPILL", "POINT"], max_guesses=2)
+        game.guess("SPILL")
+        game.guess("RAISE")
+
+        self.assertEqual(game.get_status(), Status.LOST)
+        self.assertEqual(game.get_status(0), Status.WON)
+        self.assertEqual(game.get_status(1), Status.LOST)
+
+    def test_guess_invalid_word(self):
+        game = MultiGame(["SPILL", "POINT"])
+
+        self.assertRaises(Exception, game.guess, "AAAAA")
+        self.assertEqual(game._guesses, [])
+
+    def test_words_left_counts(self):
+        game = MultiGame(["SPILL", "SKILL"])
+        game.guess("SKILL")
+
+        self.assertEqual(game.words_left_counts()[1], 1)
+        self.assertGreater(game.words_left_counts()[0], 1)
+
+    def test_render(self):
+        game = MultiGame(["SPILL", "POINT", "RAISE"], max_guesses=2)
+        game.guess("SPILL")
+        blank = colored(" ", "grey", "on_white") * 5
+
+        first = colored("S", "grey", "on_white") + \
+            colored("P", "grey", "on_yellow") + \
+            colored("I", "grey", "on_green") + \
+            colored("L", "grey", "on_white") + \
+            colored("L", "grey", "on_white")
+        third = colored("S", "grey", "on_yellow") + \
+            colored("P", "grey", "on_white") + \
+            colored("I", "grey", "on_green") + \
+            colored("L", "grey", "on_white") + \
+            colored("L", "grey", "on_white")
+        self.assertEqual(game.render(columns=2), "\n".join([
+            green("SPILL") + " " + first,
+            blank + " " + blank,
+            "",
+            third,
+            blank,
+        ]))
+        self.assertEqual(str(game), "\n".join([
+            green("SPILL") + " " + first + " " + third,
+            blank + " " + blank + " " + blank,
+        ]))
+
+    def test_repr(self):
+        game = MultiGame(["spill", "point"])
+
+        self.assertEqual(repr(game), "MultiGame(['SPILL', 'POINT'])")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import os
+import unittest
+
+from openings import (NO_REPLY, OpeningBook, build_opening_book,
+                      cached_opening_book, opening_book_key)
+from solver import Solver
+from testutil import SOLUTIONS, WORDS, temp_wordle
+
+
+class TestOpeningBook(unittest.TestCase):
+
+    def setUp(self):
+        self.wordle, self.tmp_dir = temp_wordle(self)
+
+    def test_build(self):
+        book = build_opening_book(self.wordle)
+
+        self.assertEqual(book.first_guess, "STICK")
+        # Only SKILL gets this pattern for STICK, so it's the reply.
+        game = self.wordle.start_game(solution="SKILL")
+        game.guess("STICK")
+        self.assertEqual(book.lookup(game), "SKILL")
+        self.assertIsNone(book.reply(0))
+
+    def test_lookup(self):
+        book = build_opening_book(self.wordle)
+        game = self.wordle.start_game(solution="SPILL")
+
+        self.assertEqual(book.lookup(game), "STICK")
+        game.guess("RAISE")
+        self.assertIsNone(book.lookup(game))
+        self.assertIsNone(book.lookup(self.wordle.start_game(True)))
+
+    def test_solver_uses_book(self):
+        book = OpeningBook(self.wordle.dictionary, WORDS.index("SWORD"),
+                           [NO_REPLY] * 243)
+        solver = Solver(self.wordle, opening_book=book)
+
+        self.assertEqual(solver.best_guess(self.wordle.start_game()),
+                         "SWORD")
+
+    def test_cached_opening_book(self):
+        book = cached_opening_book(self.wordle, cache_dir=self.tmp_dir)
+        files = [f for f in os.listdir(self.tmp_dir)
+                 if f.startswith("openings-")]
+        self.assertEqual(len(files), 1)
+
+        cached = cached_opening_book(self.wordle, cache_dir=self.tmp_dir)
+        self.assertEqual(cached.first_guess, book.first_guess)
+        self.assertEqual(cached._replies, book._replies)
+
+        hard = cached_opening_book(self.wordle, True, self.tmp_dir)
+        self.assertTrue(hard.hard_mode)
+
+    def test_load_rejects_other_words(self):
+        path = os.path.join(self.tmp_dir, "book.bin")
+        key = opening_book_key(WORDS, SOLUTIONS, False)
+        build_opening_book(self.wordle).save(path, key)
+
+        other = opening_book_key(WORDS, SOLUTIONS[:2], False)
+        self.assertRaises(Exception, OpeningBook.load, path,
+                          self.wordle.dictionary, other)
+        self.assertEqual(
+            OpeningBook.load(path, self.wordle.dictionary, key).first_guess,
+            "STICK")
+
+
+if __name__ == "__main__":
+    unittest.main()
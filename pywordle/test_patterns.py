@@ -0,0 +1,102 @@
+import os
+import tempfile
+import unittest
+
+from feedback import load_numpy, score
+from patterns import (PatternTable, build_pattern_table,
+                      cached_pattern_table, count_buckets, open_pattern_table)
+
+GUESSES = ["FOILS", "SWIRL", "LLAMA", "SPILL"]
+SOLUTIONS = ["SPILL", "LLAMA", "TREAT"]
+
+
+class TestPatterns(unittest.TestCase):
+
+    def test_build_pattern_table(self):
+        table = build_pattern_table(GUESSES, SOLUTIONS)
+
+        self.assertEqual(table.n_guesses, 4)
+        self.assertEqual(table.n_solutions, 3)
+        self.assertEqual(table.pattern(3, 0), 242)
+        self.assertEqual(
+            list(table.row(0)), [score("FOILS", s) for s in SOLUTIONS])
+
+    def test_save_and_load(self):
+        table = build_pattern_table(GUESSES, SOLUTIONS)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "patterns.bin")
+            table.save(path)
+            loaded = PatternTable.load(path, tuple(GUESSES), tuple(SOLUTIONS))
+
+            self.assertEqual(bytes(loaded.row(2)), bytes(table.row(2)))
+            self.assertRaises(
+                Exception, PatternTable.load, path, GUESSES, ["SPILL"])
+
+    def test_save_uses_umask(self):
+        table = build_pattern_table(GUESSES, SOLUTIONS)
+
+        umask = os.umask(0o022)
+        try:
+            with tempfile.TemporaryDirectory() as tmp:
+                path = os.path.join(tmp, "patterns.bin")
+                table.save(path)
+                self.assertEqual(os.stat(path).st_mode & 0o777, 0o644)
+        finally:
+            os.umask(umask)
+
+    def test_open(self):
+        table = build_pattern_table(GUESSES, SOLUTIONS)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "patterns.bin")
+            table.save(path)
+            mapped = PatternTable.open(path, tuple(GUESSES), tuple(SOLUTIONS))
+
+            self.assertEqual(mapped.pattern(1, 0), table.pattern(1, 0))
+            self.assertEqual(bytes(mapped.row(3)), bytes(table.row(3)))
+            self.assertRaises(
+                Exception, PatternTable.open, path, GUESSES, ["SPILL"])
+
+    @unittest.skipIf(load_numpy() is None, "NumPy is not installed")
+    def test_bucket_counts(self):
+        table = build_pattern_table(GUESSES, SOLUTIONS)
+
+        counts = table.bucket_counts()
+        self.assertEqual(counts.shape, (4, 243))
+        self.assertEqual(counts[3, 242], 1)
+        self.assertEqual(counts.sum(axis=1).tolist(), [3, 3, 3, 3])
+        self.assertEqual(
+            count_buckets(table.array(), [0, 2]).tolist(),
+            (counts - count_buckets(table.array(), [1])).tolist())
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "patterns.bin")
+            table.save(path)
+            mapped = PatternTable.open(path, tuple(GUESSES), tuple(SOLUTIONS))
+            self.assertEqual(mapped.bucket_counts().tolist(), counts.tolist())
+
+            with open(path, "r+b") as f:
+                f.truncate(os.path.getsize(path) - 1)
+            self.assertRaises(
+                Exception, PatternTable.open, path, GUESSES, SOLUTIONS)
+
+    def test_open_pattern_table_builds_missing_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "shared", "patterns.bin")
+            table = open_pattern_table(path, GUESSES, SOLUTIONS)
+
+            self.assertTrue(os.path.exists(path))
+            self.assertEqual(table.pattern(3, 0), 242)
+
+    def test_cached_pattern_table(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            table = cached_pattern_table(GUESSES, SOLUTIONS, tmp)
+            self.assertEqual(len(os.listdir(tmp)), 1)
+
+            cached = cached_pattern_table(GUESSES, SOLUTIONS, tmp)
+            self.assertEqual(bytes(cached.row(1)), bytes(table.row(1)))
+
+
+if __name__ == '__main__':
+    unittest.main()
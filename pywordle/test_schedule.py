@@ -0,0 +1,82 @@
+import datetime
+import unittest
+
+from schedule import EPOCH, Scheduler
+from wordle import Wordle
+
+SOLUTIONS = ["RAISE", "TREAT", "SPOIL", "CRANE", "SPILL", "POINT"]
+
+
+class TestScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.wordle = Wordle(SOLUTIONS)
+
+    def test_rotation_covers_every_solution(self):
+        scheduler = Scheduler(self.wordle, seed=1)
+
+        days = [scheduler.solution_for_day(day) for day in range(6)]
+        self.assertCountEqual(days, SOLUTIONS)
+        self.assertEqual(scheduler.solution_for_day(6), days[0])
+
+    def test_same_seed_agrees(self):
+        first = Scheduler(Wordle(SOLUTIONS), seed="daily")
+        second = Scheduler(Wordle(SOLUTIONS), seed="daily")
+
+        for day in range(12):
+            self.assertEqual(first.solution_for_day(day),
+                             second.solution_for_day(day))
+            self.assertEqual(first.solution_for_tenant("acme", day),
+                             second.solution_for_tenant("acme", day))
+
+    def test_dates(self):
+        scheduler = Scheduler(self.wordle)
+        day = EPOCH + datetime.timedelta(days=9)
+
+        self.assertEqual(scheduler.day_number(day), 9)
+        self.assertEqual(scheduler.solution_for_day(day),
+                         scheduler.solution_for_day(9))
+
+    def test_datetimes(self):
+        scheduler = Scheduler(self.wordle)
+        day = datetime.datetime.combine(
+            EPOCH + datetime.timedelta(days=9), datetime.time(23, 59))
+
+        self.assertEqual(scheduler.day_number(day), 9)
+        self.assertEqual(scheduler.solution_for_day(day),
+                         scheduler.solution_for_day(9))
+
+    def test_start_daily_game(self):
+        scheduler = Scheduler(self.wordle, seed=3)
+
+        game = scheduler.start_daily_game(4, hard_mode=True)
+        self.assertEqual(game._solution, scheduler.solution_for_day(4))
+        self.assertTrue(game._hard_mode)
+
+    def test_tenants(self):
+        scheduler = Scheduler(self.wordle, seed=2)
+
+        for tenant in ("acme", "globex", ""):
+            games = [scheduler.solution_for_tenant(tenant, n)
+                     for n in range(6)]
+            self.assertCountEqual(games, SOLUTIONS)
+        game = scheduler.start_tenant_game("acme", 7)
+        self.assertEqual(game._solution,
+                         scheduler.solution_for_tenant("acme", 1))
+
+
+class TestSeededWordle(unittest.TestCase):
+
+    def test_seed(self):
+        first = Wordle(SOLUTIONS, seed=5)
+        second = Wordle(SOLUTIONS, seed=5)
+
+        self.assertEqual(
+            [first.start_game()._solution for _ in range(10)],
+            [second.start_game()._solution for _ in range(10)])
+        self.assertEqual(first.start_multi_game(3)._solutions,
+                         second.start_multi_game(3)._solutions)
+
+
+if __name__ == "__main__":
+    unittest.main()
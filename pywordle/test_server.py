@@ -0,0 +1,145 @@
+import asyncio
+import json
+import unittest
+
+from server import GameServer
+from testutil import temp_wordle
+
+SOLUTIONS = ["SPILL"]
+
+
+class TestGameServer(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        wordle, _ = temp_wordle(self, SOLUTIONS)
+        self.server = GameServer(wordle, max_sessions=2)
+
+        started = asyncio.get_running_loop().create_future()
+        self.task = asyncio.ensure_future(
+            self.server.serve(port=0, started=started.set_result))
+        listening = await started
+        port = listening.sockets[0].getsockname()[1]
+        self.reader, self.writer = await asyncio.open_connection(
+            "127.0.0.1", port)
+
+    async def asyncTearDown(self):
+        self.writer.close()
+        self.task.cancel()
+        try:
+            await self.task
+        except asyncio.CancelledError:
+            pass
+
+    async def request(self, **request):
+        self.writer.write(json.dumps(request).encode() + b"\n")
+        await self.writer.drain()
+        return json.loads(await self.reader.readline())
+
+    async def test_game(self):
+        response = await self.request(op="new", id=1)
+        self.assertTrue(response["ok"])
+        self.assertEqual(response["id"], 1)
+        session = response["session"]
+
+        response = await self.request(op="guess", session=session, word="SKILL")
+        self.assertEqual(response["feedback"], [2, 0, 2, 2, 2])
+        self.assertEqual(response["status"], "IN_PROGRESS")
+        self.assertEqual(response["left"], 4)
+
+        response = await self.request(op="guess", session=session, word="SPILL")
+        self.assertEqual(response["status"], "WON")
+        self.assertEqual(response["solution"], "SPILL")
+
+        response = await self.request(op="end", session=session)
+        self.assertTrue(response["ok"])
+        self.assertEqual(self.server.sessions, {})
+
+    async def test_hint(self):
+        session = (await self.request(op="new"))["session"]
+        response = await self.request(op="hint", session=session, limit=1)
+        self.assertEqual(response["hints"], [["SPILL", 0.0]])
+
+    async def test_valid(self):
+        session = (await self.request(op="new"))["session"]
+        response = await self.request(op="valid", session=session, word="SWORD")
+        self.assertTrue(response["valid"])
+        response = await self.request(op="valid", session=session, word="ABCDE")
+        self.assertFalse(response["valid"])
+
+    async def test_errors(self):
+        response = await self.request(op="guess", session="none", word="SKILL")
+        self.assertEqual(response, {"ok": False, "error": "Unknown session"})
+
+        session = (await self.request(op="new"))["session"]
+        response = await self.request(op="guess", session=session, word="ABCDE")
+        self.assertFalse(response["ok"])
+        response = await self.request(op="fly", session=session)
+        self.assertEqual(response["error"], "Unknown op")
+
+        self.writer.write(b"not json\n")
+        response = json.loads(await self.reader.readline())
+        self.assertEqual(response["error"], "Malformed request")
+
+    async def test_invalid_numbers(self):
+        for max_guesses in ("abc", -3, 0, 256, None, True, 2.5):
+            response = await self.request(op="new", max_guesses=max_guesses)
+            self.assertEqual(response, {"ok": False,
+                                        "error": "Invalid max_guesses"})
+        self.assertEqual(self.server.sessions, {})
+
+        response = await self.request(op="new", max_guesses=255)
+        self.assertEqual(response["max_guesses"], 255)
+        session = response["session"]
+        for limit in (None, "5", 0, 101):
+            response = await self.request(
+                op="hint", session=session, limit=limit)
+            self.assertEqual(response["error"], "Invalid limit")
+
+    async def test_invalid_hard_mode(self):
+        for hard_mode in ("false", 0, 1, [0], None):
+            response = await self.request(op="new", hard_mode=hard_mode)
+            self.assertEqual(response, {"ok": False,
+                                        "error": "Invalid hard_mode"})
+        self.assertEqual(self.server.sessions, {})
+
+        response = await self.request(op="new", hard_mode=True)
+        self.assertTrue(response["ok"])
+
+    async def test_max_sessions(self):
+        await self.request(op="new")
+        await self.request(op="new")
+        response = await self.request(op="new")
+        self.assertEqual(response["error"], "Too many games in progress")
+
+    async def test_evict_idle(self):
+        first = (await self.request(op="new"))["session"]
+        second = (await self.request(op="new"))["session"]
+        self.server._idle_timeout = 0
+        self.assertEqual(self.server.evict_idle(), 2)
+        self.assertEqual(self.server.sessions, {})
+        response = await self.request(op="end", session=first)
+        self.assertEqual(response["error"], "Unknown session")
+        self.assertNotEqual(first, second)
+
+
+class TestGameServerOutsideLoop(unittest.TestCase):
+
+    def test_pending_hints(self):
+        # Servers are usually made before the event loop is started.
+        wordle, _ = temp_wordle(self, SOLUTIONS)
+        server = GameServer(wordle, max_pending_hints=1)
+        session = server._new({})["session"]
+
+        async def hints():
+            line = json.dumps(
+                {"op": "hint", "session": session, "limit": 1})
+            return await asyncio.gather(
+                *[server.respond(line) for _ in range(5)])
+
+        for response in asyncio.run(hints()):
+            self.assertEqual(response,
+                             {"ok": True, "hints": [("SPILL", 0.0)]})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import pickle
+import unittest
+
+from simulate import simulate
+from solver import Solver
+from testutil import SOLUTIONS, temp_wordle
+
+
+def first_candidate(game):
+    return game.words_left[0]
+
+
+class TestSimulate(unittest.TestCase):
+
+    def setUp(self):
+        self.wordle, _ = temp_wordle(self)
+
+    def test_simulate(self):
+        result = simulate(self.wordle, first_candidate, workers=1)
+
+        self.assertEqual([g.solution for g in result.games], SOLUTIONS)
+        self.assertEqual(result.win_rate, 1.0)
+        # SPILL is always guessed first, which leaves only RAISE when it is
+        # the solution and SKILL, STILL and SHILL to try in order otherwise.
+        self.assertEqual(result.distribution, {1: 1, 2: 2, 3: 1, 4: 1})
+        self.assertEqual(result.mean_guesses, 12 / 5)
+
+    def test_simulate_lost_games(self):
+        result = simulate(
+            self.wordle, first_candidate, workers=1, max_guesses=2)
+
+        self.assertEqual(result.win_rate, 3 / 5)
+        self.assertEqual(sum(g.guesses for g in result.games), 9)
+
+    def test_simulate_worker_processes(self):
+        serial = simulate(self.wordle, first_candidate, workers=1)
+        parallel = simulate(
+            self.wordle, first_candidate, workers=2, chunk_size=2)
+
+        self.assertEqual([g[:3] for g in parallel.games],
+                         [g[:3] for g in serial.games])
+
+    def test_simulate_solver(self):
+        solver = Solver(self.wordle)
+
+        result = simulate(self.wordle, solver.best_guess, workers=2)
+
+        self.assertEqual(result.win_rate, 1.0)
+        self.assertEqual(len(result.games), len(SOLUTIONS))
+
+    def test_pickle_wordle_maps_pattern_table(self):
+        table = self.wordle.patterns
+
+        copy = pickle.loads(pickle.dumps(self.wordle))
+
+        self.assertEqual(copy.patterns.path, table.path)
+        self.assertEqual(bytes(copy.patterns.row(0)), bytes(table.row(0)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+
+from feedback import score
+from solver import Solver, _entropy
+from testutil import SOLUTIONS, WORDS, temp_wordle
+
+
+class TestSolver(unittest.TestCase):
+
+    def setUp(self):
+        self.wordle, _ = temp_wordle(self)
+        self.solver = Solver(self.wordle)
+
+    def test_rank(self):
+        game = self.wordle.start_game(solution="SPILL")
+
+        ranking = self.solver.rank(game, limit=None)
+
+        self.assertEqual(len(ranking), len(WORDS))
+        self.assertEqual([bits for _, bits in ranking],
+                         sorted((bits for _, bits in ranking), reverse=True))
+        # STICK tells SKILL, SPILL, STILL, SHILL and RAISE apart in one go.
+        self.assertEqual(ranking[0][0], "STICK")
+
+    def test_rank_limit(self):
+        game = self.wordle.start_game(solution="SPILL")
+
+        self.assertEqual(len(self.solver.rank(game, limit=3)), 3)
+
+    def test_rank_prefers_possible_solutions(self):
+        game = self.wordle.start_game(solution="SPILL")
+        game.guess("RAISE")
+        game.guess("STICK")
+
+        # Only SPILL and SHILL are left, so guessing either of them is as
+        # informative as any other guess and might win the game.
+        self.assertEqual(self.solver.rank(game, limit=2),
+                         [("SPILL", 1.0), ("SHILL", 1.0)])
+
+    def test_rank_hard_mode(self):
+        game = self.wordle.start_game(hard_mode=True, solution="SPILL")
+        game.guess("SWORD")
+
+        for guess, _ in self.solver.rank(game, limit=None):
+            self.assertTrue(game.is_valid(guess))
+
+    def test_rank_bitsets(self):
+        game = self.wordle.start_game(hard_mode=True, solution="SPILL")
+        game.guess("SWORD")
+
+        self.assertEqual(
+            self.solver.rank_bitsets(game.candidates, game.allowed, None),
+            self.solver.rank(game, limit=None))
+
+    def test_entropies(self):
+        index = self.wordle.dictionary.index
+        # Every solution, most of them and a few of them are counted
+        # differently, as are words that aren't solutions, but all must
+        # score the same as counting directly.
+        for candidates in (SOLUTIONS, SOLUTIONS[:4], SOLUTIONS[:2],
+                           ["CHILL", "SWORD", "SPILL"], WORDS):
+            mask = sum(1 << index(word) for word in candidates)
+            scores = self.solver.entropies(mask)
+            for i, guess in enumerate(WORDS):
+                expected = _entropy([score(guess, c) for c in candidates],
+                                    len(candidates))
+                self.assertAlmostEqual(float(scores[i]), expected)
+
+    def test_best_guess(self):
+        game = self.wordle.start_game(solution="SKILL")
+
+        self.assertEqual(self.solver.best_guess(game), "STICK")
+
+
+if __name__ == '__main__':
+    unittest.main()
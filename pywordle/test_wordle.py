@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 
 from wordle import Wordle
@@ -23,11 +25,57 @@ class TestWordle(unittest.TestCase):
         game = wordle.start_game(False, "RAISE")
         self.assertEqual(game._solution, "RAISE")
 
+    def test_start_game_with_lower_case_solution(self):
+        wordle = Wordle(SOLUTIONS)
+
+        game = wordle.start_game(False, "raise")
+        self.assertEqual(game._solution, "RAISE")
+
+    def test_solution_id(self):
+        wordle = Wordle(SOLUTIONS)
+
+        self.assertEqual(wordle.solution_id("TREAT"), 1)
+        self.assertEqual(wordle.solution_id("spoil"), 2)
+        self.assertIsNone(wordle.solution_id("FOIST"))
+
+    def test_start_game_by_id(self):
+        wordle = Wordle(SOLUTIONS)
+
+        game = wordle.start_game_by_id(2, hard_mode=True)
+        self.assertEqual(game._solution, "SPOIL")
+        self.assertTrue(game._hard_mode)
+        self.assertRaises(Exception, wordle.start_game_by_id, 3)
+        self.assertRaises(Exception, wordle.start_game_by_id, -1)
+
+    def test_start_multi_game(self):
+        wordle = Wordle(SOLUTIONS)
+
+        game = wordle.start_multi_game(3)
+        self.assertCountEqual(game._solutions, SOLUTIONS)
+        self.assertEqual(game._max_guesses, 8)
+
+    def test_start_multi_game_invalid_word(self):
+        wordle = Wordle(SOLUTIONS)
+
+        self.assertRaises(Exception, wordle.start_multi_game,
+                          solutions=["RAISE", "SPILL"])
+
     def test_start_game_invalid_word(self):
         wordle = Wordle(SOLUTIONS)
 
         self.assertRaises(Exception, wordle.start_game, False, "FOIST")
 
+    def test_pattern_table_path(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "patterns.bin")
+            wordle = Wordle(SOLUTIONS, pattern_table=path)
+
+            table = wordle.patterns
+            self.assertTrue(os.path.exists(path))
+            self.assertEqual(table.n_solutions, 3)
+            index = wordle.dictionary.index("TREAT")
+            self.assertEqual(table.pattern(index, 1), 242)
+
     def test_repr(self):
         wordle = Wordle(SOLUTIONS)
 
@@ -0,0 +1,26 @@
+import unittest
+
+from words import RECORD_LEN, read_words, unpack_words, VALID_WORDS
+
+
+class TestWords(unittest.TestCase):
+
+    def test_read_words(self):
+        data = read_words()
+
+        self.assertEqual(len(data), RECORD_LEN * 12972)
+        self.assertEqual(data[:RECORD_LEN], b"AAHED")
+
+    def test_unpack_words(self):
+        self.assertListEqual(
+            unpack_words(b"RAISETREATSPOIL"), ["RAISE", "TREAT", "SPOIL"])
+        self.assertListEqual(unpack_words(b""), [])
+
+    def test_valid_words(self):
+        self.assertEqual(len(VALID_WORDS), 12972)
+        self.assertEqual(VALID_WORDS[0], "AAHED")
+        self.assertEqual(VALID_WORDS[-1], "SHAVE")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,33 @@
+"""
+Word lists and games shared by the tests.
+"""
+import os
+import tempfile
+
+from dictionary import Dictionary
+from wordle import Wordle
+
+WORDS = ["SPILL", "SKILL", "STILL", "SHILL", "SWILL", "CHILL", "STICK",
+         "SWORD", "RAISE"]
+SOLUTIONS = ["SPILL", "SKILL", "STILL", "SHILL", "RAISE"]
+
+
+def temp_wordle(test, solutions=SOLUTIONS):
+    """
+    Makes a Wordle of WORDS with its pattern table in a temporary directory,
+    which is removed once the test is done.
+
+    Args:
+        test: The TestCase using the Wordle.
+        solutions: The Wordle's solutions.
+
+    Returns:
+        The Wordle and the path of the temporary directory, which tests can
+        also keep their own files in.
+    """
+    tmp = tempfile.TemporaryDirectory()
+    test.addCleanup(tmp.cleanup)
+    wordle = Wordle(
+        solutions, Dictionary(WORDS),
+        pattern_table=os.path.join(tmp.name, "patterns.bin"))
+    return wordle, tmp.name
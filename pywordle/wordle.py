@@ -1,20 +1,86 @@
+import os
 import random
+import time
 
+from pywordle import metrics
+from pywordle.dictionary import DICTIONARY
 from pywordle.game import Game, WORD_LEN
+from pywordle.multigame import MultiGame
+from pywordle.patterns import (PatternTable, cached_pattern_table,
+                               open_pattern_table)
 
 
 class Wordle:
     """Represents a class of games with a set of possible solutions."""
 
-    def __init__(self, solutions):
+    def __init__(self, solutions, dictionary=None, pattern_table=None,
+                 seed=None):
         """
         Args:
             solutions: List of possible solutions
+            dictionary: The Dictionary of valid guesses. Defaults to the
+                shared dictionary of all valid words.
+            pattern_table: Optionally a PatternTable, or the path of a file
+                to memory-map it from. Worker processes given the same path
+                share one read-only copy of the table. The file is built the
+                first time it is needed if it doesn't exist yet.
+            seed: Optionally seeds the choice of random solutions, so that
+                the same solutions are picked on every run.
         """
         if not all(len(s) == WORD_LEN for s in solutions):
             raise Exception("Solutions are the wrong length")
 
         self.solutions = list(map(lambda x: x.upper(), solutions))
+        self.dictionary = DICTIONARY if dictionary is None else dictionary
+
+        # Each Wordle picks solutions with its own generator, so games
+        # started from different Wordles don't affect each other.
+        self._random = random.Random(seed)
+
+        # Map from each solution to its first position in the solutions.
+        self._solution_ids = {}
+        for i, solution in enumerate(self.solutions):
+            self._solution_ids.setdefault(solution, i)
+
+        # Built or loaded from the cache the first time it is needed.
+        self._patterns = None
+        self._pattern_path = None
+        if isinstance(pattern_table, PatternTable):
+            self._patterns = pattern_table
+        elif pattern_table is not None:
+            self._pattern_path = os.fspath(pattern_table)
+
+    @property
+    def patterns(self):
+        """
+        Returns:
+            A PatternTable with the feedback of every valid guess against
+            every solution.
+        """
+        if self._patterns is not None:
+            return self._patterns
+
+        start = time.perf_counter()
+        if self._pattern_path is not None:
+            self._patterns = open_pattern_table(
+                self._pattern_path, self.dictionary.words, self.solutions)
+        else:
+            self._patterns = cached_pattern_table(
+                self.dictionary.words, self.solutions)
+        if metrics.active is not None:
+            metrics.active.time("wordle.patterns", time.perf_counter() - start)
+        return self._patterns
+
+    def solution_id(self, solution):
+        """
+        Args:
+            solution: A word, in any case.
+
+        Returns:
+            The position of the word in the solutions, or None if it isn't a
+            solution.
+        """
+        return self._solution_ids.get(solution.upper())
 
     def start_game(self, hard_mode=False, solution=None, max_guesses=None):
         """
@@ -27,11 +93,50 @@ class Wordle:
             A Game instance.
         """
         if not solution:
-            solution = random.choice(self.solutions)
-        elif solution not in self.solutions:
+            solution = self._random.choice(self.solutions)
+        elif self.solution_id(solution) is None:
+            raise Exception("Solution isn't a valid word")
+
+        if metrics.active is not None:
+            metrics.active.count("games_started")
+        return Game(solution, hard_mode, max_guesses, self.dictionary)
+
+    def start_game_by_id(self, solution_id, hard_mode=False,
+                         max_guesses=None):
+        """
+        Args:
+            solution_id: The position of the solution in the solutions.
+            hard_mode: True if previous known letters must be used.
+            max_guesses: The number of guesses allowed.
+
+        Returns:
+            A Game instance.
+
+        Raises:
+            Exception: When there is no solution with the id.
+        """
+        if not 0 <= solution_id < len(self.solutions):
+            raise Exception("No solution with id {0}".format(solution_id))
+
+        return self.start_game(hard_mode, self.solutions[solution_id],
+                               max_guesses)
+
+    def start_multi_game(self, boards=4, solutions=None, max_guesses=None):
+        """
+        Args:
+            boards: The number of boards to play at once.
+            solutions: Optionally provide the solution for each board.
+            max_guesses: The number of guesses allowed.
+
+        Returns:
+            A MultiGame instance.
+        """
+        if not solutions:
+            solutions = self._random.sample(self.solutions, boards)
+        elif any(self.solution_id(s) is None for s in solutions):
             raise Exception("Solution isn't a valid word")
 
-        return Game(solution, hard_mode, max_guesses)
+        return MultiGame(solutions, max_guesses, self.dictionary)
 
     def __repr__(self):
         return "Wordle({0})".format(self.solutions)
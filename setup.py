@@ -4,8 +4,8 @@ setup(name='pywordle',
       version='1.0',
       description='Wordle Game Engine',
       packages=['pywordle'],
+      package_data={'pywordle': ['words.bin']},
       requires=[
           "termcolor",
           "enum",
-          "matplotlib",
       ],)